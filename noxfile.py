@@ -34,6 +34,7 @@ def coverage(session: nox.Session) -> None:
     """Run tests with coverage on specified Python version."""
     session.install("-e", ".")
     session.install(
+        "filelock",
         "pytest",
         "pytest-cov",
         "pytest-asyncio",
@@ -10,6 +10,7 @@
     IcapTimeoutError,
 )
 from .icap import IcapClient
+from .pool import IcapClientPool
 from .response import IcapResponse
 
 # Set up logging with NullHandler to avoid "No handler found" warnings
@@ -20,6 +21,7 @@
 __all__ = [
     "AsyncIcapClient",
     "IcapClient",
+    "IcapClientPool",
     "IcapResponse",
     "IcapException",
     "IcapConnectionError",
@@ -4,7 +4,11 @@
 shared between the sync IcapClient and async AsyncIcapClient.
 """
 
-from typing import Dict, Optional
+from functools import lru_cache
+from typing import Dict, Optional, Tuple, Type, Union
+
+from .exception import IcapException, IcapProtocolError, IcapServerError
+from .response import IcapResponse
 
 
 class IcapProtocol:
@@ -16,6 +20,27 @@ class IcapProtocol:
     BUFFER_SIZE: int = 8192
     USER_AGENT: str = "Python-ICAP-Client/1.0"
 
+    # Fixed part of the encapsulated HTTP response header; only the length varies
+    _HTTP_RESPONSE_HEADER_PREFIX: bytes = (
+        b"HTTP/1.1 200 OK\r\nContent-Type: application/octet-stream\r\nContent-Length: "
+    )
+
+    # Exception raised for each status class (status_code // 100) that is an error
+    STATUS_CLASS_ERRORS: Dict[int, Type[IcapException]] = {5: IcapServerError}
+
+    def _raise_for_status(self, response: IcapResponse) -> None:
+        """Raise the exception mapped to the response's status class, if any.
+
+        Args:
+            response: Parsed ICAP response
+
+        Raises:
+            IcapServerError: If the server returned a 5xx status code.
+        """
+        error = self.STATUS_CLASS_ERRORS.get(response.status_code // 100)
+        if error is not None:
+            raise error(f"ICAP server error: {response.status_code} {response.status_message}")
+
     def _build_request(self, request_line: str, headers: Dict[str, str]) -> bytes:
         """Build ICAP request from request line and headers.
 
@@ -26,11 +51,11 @@ def _build_request(self, request_line: str, headers: Dict[str, str]) -> bytes:
         Returns:
             Encoded request bytes
         """
-        request = request_line
-        for key, value in headers.items():
-            request += f"{key}: {value}{self.CRLF}"
-        request += self.CRLF
-        return request.encode("utf-8")
+        # Collect the lines and join once rather than growing a string per header
+        lines = [request_line]
+        lines.extend(f"{key}: {value}{self.CRLF}" for key, value in headers.items())
+        lines.append(self.CRLF)
+        return "".join(lines).encode("utf-8")
 
     def _build_http_request_header(self, filename: Optional[str]) -> bytes:
         """Build encapsulated HTTP request header for file scanning.
@@ -53,12 +78,7 @@ def _build_http_response_header(self, content_length: int) -> bytes:
         Returns:
             HTTP response header bytes
         """
-        return (
-            f"HTTP/1.1 200 OK\r\n"
-            f"Content-Type: application/octet-stream\r\n"
-            f"Content-Length: {content_length}\r\n"
-            f"\r\n"
-        ).encode()
+        return self._HTTP_RESPONSE_HEADER_PREFIX + b"%d\r\n\r\n" % content_length
 
     def _build_http_response_header_chunked(self) -> bytes:
         """Build encapsulated HTTP response header for chunked transfer.
@@ -85,8 +105,22 @@ def _encode_chunked(data: bytes) -> bytes:
         """
         if not data:
             return b""
-        chunk_size = f"{len(data):X}\r\n"
-        return chunk_size.encode() + data + b"\r\n"
+        return IcapProtocol._chunk_header(len(data)) + data + b"\r\n"
+
+    @staticmethod
+    @lru_cache(maxsize=64)
+    def _chunk_header(size: int) -> bytes:
+        """Return the chunk-size line for a chunk of the given size.
+
+        Streaming sends many chunks of the same size, so the encoded line is cached.
+
+        Args:
+            size: Chunk length in bytes
+
+        Returns:
+            Hex chunk size followed by CRLF
+        """
+        return f"{size:X}\r\n".encode()
 
     @staticmethod
     def _encode_chunk_terminator() -> bytes:
@@ -96,3 +130,201 @@ def _encode_chunk_terminator() -> bytes:
             Zero-length chunk terminator bytes
         """
         return b"0\r\n\r\n"
+
+    def _build_preview_request(self, request: bytes, body: bytes, preview_size: int) -> bytes:
+        """Build a request followed by its preview chunk, ready to send in one write.
+
+        Per RFC 3507 Section 4.5, the zero-length chunk that ends the preview
+        carries the "ieof" extension when the entire body fits in the preview.
+
+        Args:
+            request: The ICAP request (headers + encapsulated HTTP headers)
+            body: The full HTTP body being sent
+            preview_size: Number of body bytes to send in the preview
+
+        Returns:
+            Request, chunk-encoded preview and preview terminator as one message
+        """
+        preview = memoryview(body)[:preview_size]
+        parts = [request]
+        if preview:
+            parts += (self._chunk_header(len(preview)), preview, b"\r\n")
+        if len(body) <= preview_size:
+            parts.append(b"0; ieof\r\n\r\n")
+        else:
+            parts.append(self._encode_chunk_terminator())
+        return b"".join(parts)
+
+    def _build_preview_remainder(self, body: bytes, preview_size: int) -> bytes:
+        """Build the rest of a previewed body, sent after a 100 Continue.
+
+        Args:
+            body: The full HTTP body being sent
+            preview_size: Number of body bytes already sent in the preview
+
+        Returns:
+            The remaining bytes as one chunk plus the terminator, in one message
+        """
+        remainder = memoryview(body)[preview_size:]
+        if not remainder:
+            return self._encode_chunk_terminator()
+        return b"".join(
+            (
+                self._chunk_header(len(remainder)),
+                remainder,
+                b"\r\n",
+                self._encode_chunk_terminator(),
+            )
+        )
+
+    def _parse_body_framing(self, header_section: bytes) -> Tuple[Optional[int], bool]:
+        """Find how the body that follows a response's headers is framed.
+
+        Header names are matched against a copy of the section lowercased with a
+        single bytes.lower() call, rather than decoding and lowercasing each name.
+
+        Like http.client, 1xx and 204 responses are treated as having no body
+        without scanning their headers: RFC 3507 section 4.6 says a 204 means
+        the original content is used unchanged, so nothing is read or copied
+        for the most common clean-scan reply.
+
+        Args:
+            header_section: Raw status line and headers, without the blank line
+
+        Returns:
+            Tuple of (Content-Length value or None, whether the body is chunked)
+
+        Raises:
+            IcapProtocolError: If a header name is followed by whitespace before its
+                colon, or Content-Length is not a plain decimal number or appears
+                more than once with different values.
+        """
+        # Status code is the three bytes after the first space of the status line
+        code_start = header_section.find(b" ") + 1
+        code = header_section[code_start : code_start + 3]
+        if code == b"204" or code[:1] == b"1":
+            return None, False
+
+        lowered = header_section.lower()
+        content_length = None
+        is_chunked = False
+
+        # Skip the status line, then visit each header line
+        line_end = lowered.find(b"\r\n")
+        while line_end != -1:
+            start = line_end + 2
+            line_end = lowered.find(b"\r\n", start)
+            end = len(lowered) if line_end == -1 else line_end
+            colon = lowered.find(b":", start, end)
+            if colon == -1:
+                continue
+            name = lowered[start:colon]
+            if name[-1:] in (b" ", b"\t"):
+                # RFC 7230 section 3.2.4: no whitespace between field name and colon
+                raise IcapProtocolError(
+                    f"Invalid header field name: {header_section[start:colon]!r}"
+                )
+            if name == b"content-length":
+                value = self._parse_content_length(header_section[colon + 1 : end].strip())
+                if content_length is not None and value != content_length:
+                    raise IcapProtocolError(
+                        f"Conflicting Content-Length headers: {content_length} and {value}"
+                    )
+                content_length = value
+            elif name == b"transfer-encoding" and b"chunked" in lowered[colon + 1 : end]:
+                is_chunked = True
+
+        return content_length, is_chunked
+
+    @staticmethod
+    def _parse_content_length(value: bytes) -> int:
+        """Parse a raw Content-Length header value.
+
+        The bytes are validated before any decoding, and unlike int(), only
+        ASCII digits are accepted: signs, "_" separators and any other bytes
+        are rejected.
+
+        Args:
+            value: Header value with surrounding whitespace removed
+
+        Returns:
+            Content length in bytes
+
+        Raises:
+            IcapProtocolError: If the value is not a plain decimal number.
+        """
+        # bytes.isdigit() is ASCII-only and False for an empty value
+        if not value.isdigit():
+            raise IcapProtocolError(f"Invalid Content-Length header: {value!r}")
+        return int(value)
+
+    @staticmethod
+    def _parse_chunk_size(size_line: bytes) -> int:
+        """Parse the hex size from a chunk-size line.
+
+        Unlike int(..., 16), only plain hex digits are accepted: signs, "0x"
+        prefixes and "_" separators are rejected.
+
+        Args:
+            size_line: Chunk-size line without its CRLF, possibly with extensions
+
+        Returns:
+            Chunk size in bytes
+
+        Raises:
+            IcapProtocolError: If the size is empty or not valid hex.
+        """
+        # Chunk size may have extensions after semicolon, ignore them
+        size_field = size_line.split(b";", 1)[0].strip()
+        # Deleting every hex digit must leave nothing behind
+        if not size_field or size_field.translate(None, b"0123456789abcdefABCDEF"):
+            raise IcapProtocolError(f"Invalid chunk size in response: {size_line!r}")
+        return int(size_field, 16)
+
+    @staticmethod
+    def _decode_chunked(data: Union[bytes, bytearray], out: bytearray) -> Tuple[int, bool]:
+        """Decode every complete chunk in data, appending the payloads to out.
+
+        The buffer is walked once by offset, so no intermediate copies of the
+        remaining data are made per chunk. Incomplete trailing chunks are left
+        for the caller to retry once more data has arrived.
+
+        Args:
+            data: Raw chunked-encoded bytes received so far
+            out: Buffer that decoded chunk payloads are appended to
+
+        Returns:
+            Tuple of (bytes consumed from data, whether the terminating chunk
+            and trailer were reached)
+
+        Raises:
+            IcapProtocolError: If a chunk-size line is not valid hex.
+        """
+        # Release the view on return so the caller can resize a bytearray buffer
+        with memoryview(data) as view:
+            pos = 0
+            while True:
+                line_end = data.find(b"\r\n", pos)
+                if line_end == -1:
+                    return pos, False
+
+                chunk_size = IcapProtocol._parse_chunk_size(bytes(data[pos:line_end]))
+
+                if chunk_size == 0:
+                    # Final chunk - skip any trailer fields up to the empty line
+                    trailer = line_end + 2
+                    while True:
+                        trailer_end = data.find(b"\r\n", trailer)
+                        if trailer_end == -1:
+                            return pos, False
+                        if trailer_end == trailer:
+                            return trailer_end + 2, True
+                        trailer = trailer_end + 2
+
+                chunk_start = line_end + 2
+                chunk_end = chunk_start + chunk_size
+                if chunk_end + 2 > len(data):  # +2 for trailing CRLF
+                    return pos, False
+
+                out += view[chunk_start:chunk_end]
+                pos = chunk_end + 2
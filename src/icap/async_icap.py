@@ -7,7 +7,7 @@
 from typing import Any, BinaryIO, Dict, Optional, Union
 
 from ._protocol import IcapProtocol
-from .exception import IcapConnectionError, IcapProtocolError, IcapServerError, IcapTimeoutError
+from .exception import IcapConnectionError, IcapProtocolError, IcapTimeoutError
 from .response import IcapResponse
 
 logger = logging.getLogger(__name__)
@@ -495,7 +495,7 @@ async def _scan_stream_chunked(
         Returns:
             IcapResponse object
         """
-        if not self.is_connected:
+        if self._writer is None:
             await self.connect()
 
         if self._writer is None or self._reader is None:
@@ -536,10 +536,9 @@ async def _scan_stream_chunked(
 
             total_bytes = 0
             async for chunk in self._iter_chunks(stream, chunk_size):
-                chunk_header = f"{len(chunk):X}\r\n".encode()
-                self._writer.write(chunk_header)
-                self._writer.write(chunk)
-                self._writer.write(b"\r\n")
+                # Hand header, data and CRLF to the transport together so it
+                # can flush them with a single scatter-gather send
+                self._writer.writelines((self._chunk_header(len(chunk)), chunk, b"\r\n"))
                 await self._writer.drain()
                 total_bytes += len(chunk)
 
@@ -553,7 +552,6 @@ async def _scan_stream_chunked(
         except asyncio.TimeoutError:
             raise IcapTimeoutError(f"Request to {self.host}:{self.port} timed out") from None
         except OSError as e:
-            self._connected = False
             raise IcapConnectionError(f"Connection error with {self.host}:{self.port}: {e}") from e
 
         # Parse response
@@ -563,10 +561,7 @@ async def _scan_stream_chunked(
             raise IcapProtocolError(f"Failed to parse ICAP response: {e}") from e
 
         # Check for server errors
-        if 500 <= response.status_code < 600:
-            raise IcapServerError(
-                f"ICAP server error: {response.status_code} {response.status_message}"
-            )
+        self._raise_for_status(response)
 
         return response
 
@@ -624,100 +619,69 @@ async def _send_and_receive(self, request: bytes) -> IcapResponse:
             raise IcapProtocolError(f"Failed to parse ICAP response: {e}") from e
 
         # Check for server errors
-        if 500 <= response.status_code < 600:
-            raise IcapServerError(
-                f"ICAP server error: {response.status_code} {response.status_message}"
-            )
+        self._raise_for_status(response)
 
         return response
 
     async def _receive_response(self) -> bytes:
-        """Receive and return raw ICAP response data."""
+        """Receive and return raw ICAP response data.
+
+        The header block is taken with a single readuntil(), and the body
+        framing is read from it by the same scanner the sync client uses, so
+        the headers are never re-split or re-scanned while the body arrives.
+        """
         if self._reader is None:
             raise IcapConnectionError("Not connected to ICAP server")
 
-        response_data = b""
-        header_end_marker = b"\r\n\r\n"
+        try:
+            response_data = await asyncio.wait_for(
+                self._reader.readuntil(b"\r\n\r\n"),
+                timeout=self._timeout,
+            )
+        except asyncio.IncompleteReadError as e:
+            raise IcapProtocolError(
+                f"Connection closed before response headers complete "
+                f"({len(e.partial)} bytes received)"
+            ) from None
+        except asyncio.LimitOverrunError:
+            raise IcapProtocolError("Response headers exceed the stream buffer limit") from None
+        except asyncio.TimeoutError:
+            raise IcapTimeoutError(
+                f"Timeout reading response from {self.host}:{self.port}"
+            ) from None
+
+        content_length, is_chunked = self._parse_body_framing(response_data[:-4])
 
-        # Read until we get the complete headers
-        while header_end_marker not in response_data:
+        if content_length is not None:
+            # Read exactly Content-Length bytes
+            logger.debug(f"Reading {content_length} bytes of body content")
             try:
-                chunk = await asyncio.wait_for(
-                    self._reader.read(self.BUFFER_SIZE),
+                response_data += await asyncio.wait_for(
+                    self._reader.readexactly(content_length),
                     timeout=self._timeout,
                 )
-                if not chunk:
-                    break
-                response_data += chunk
+            except asyncio.IncompleteReadError as e:
+                raise IcapProtocolError(
+                    f"Incomplete response: expected {content_length} bytes, got {len(e.partial)}"
+                ) from None
             except asyncio.TimeoutError:
                 raise IcapTimeoutError(
-                    f"Timeout reading response from {self.host}:{self.port}"
+                    f"Timeout reading response body from {self.host}:{self.port}"
                 ) from None
 
-        # Parse headers to determine if there's a body
-        if header_end_marker in response_data:
-            header_section, body_start = response_data.split(header_end_marker, 1)
-            headers_str = header_section.decode("utf-8", errors="ignore")
-
-            content_length = None
-            is_chunked = False
-            for line in headers_str.split("\r\n")[1:]:
-                if ":" in line:
-                    key, value = line.split(":", 1)
-                    key_lower = key.strip().lower()
-                    value_stripped = value.strip().lower()
-                    if key_lower == "content-length":
-                        try:
-                            content_length = int(value.strip())
-                        except ValueError:
-                            raise IcapProtocolError(
-                                f"Invalid Content-Length header: {value.strip()!r}"
-                            ) from None
-                    elif key_lower == "transfer-encoding" and "chunked" in value_stripped:
-                        is_chunked = True
-
-            if content_length is not None:
-                # Read exactly Content-Length bytes
-                logger.debug(f"Reading {content_length} bytes of body content")
-                response_data = header_section + header_end_marker
-                bytes_read = len(body_start)
-                response_data += body_start
-
-                while bytes_read < content_length:
-                    try:
-                        chunk = await asyncio.wait_for(
-                            self._reader.read(min(self.BUFFER_SIZE, content_length - bytes_read)),
-                            timeout=self._timeout,
-                        )
-                        if not chunk:
-                            break
-                        response_data += chunk
-                        bytes_read += len(chunk)
-                    except asyncio.TimeoutError:
-                        raise IcapTimeoutError(
-                            f"Timeout reading response body from {self.host}:{self.port}"
-                        ) from None
-
-                # Validate we received all expected bytes
-                if bytes_read < content_length:
-                    raise IcapProtocolError(
-                        f"Incomplete response: expected {content_length} bytes, got {bytes_read}"
-                    )
-
-            elif is_chunked:
-                # Read chunked transfer encoding
-                logger.debug("Reading chunked response body")
-                response_data = header_section + header_end_marker
-                chunked_body = await self._read_chunked_body(body_start)
-                response_data += chunked_body
+        elif is_chunked:
+            # Read chunked transfer encoding
+            logger.debug("Reading chunked response body")
+            response_data += await self._read_chunked_body()
 
         return response_data
 
-    async def _read_chunked_body(self, initial_data: bytes) -> bytes:
-        """Read a chunked transfer encoded body.
+    async def _read_chunked_body(self) -> bytes:
+        """Read a chunked transfer encoded body from the stream.
 
-        Args:
-            initial_data: Any data already read after the headers
+        Size lines and trailers are read with readuntil() and chunk data with
+        readexactly(), so the reader's own buffer does the work and nothing past
+        the body is read.
 
         Returns:
             The decoded (de-chunked) body content
@@ -725,54 +689,39 @@ async def _read_chunked_body(self, initial_data: bytes) -> bytes:
         if self._reader is None:
             raise IcapConnectionError("Not connected to ICAP server")
 
-        buffer = initial_data
-        body = b""
+        reader = self._reader
+        buffer = bytearray()
+        body = bytearray()
 
-        while True:
-            # Ensure we have enough data to read the chunk size line
-            while b"\r\n" not in buffer:
-                try:
-                    chunk = await asyncio.wait_for(
-                        self._reader.read(self.BUFFER_SIZE),
-                        timeout=self._timeout,
-                    )
-                    if not chunk:
-                        raise IcapProtocolError("Connection closed before chunked body complete")
-                    buffer += chunk
-                except asyncio.TimeoutError:
-                    raise IcapTimeoutError(
-                        f"Timeout reading chunked body from {self.host}:{self.port}"
-                    ) from None
-
-            # Parse chunk size (hex)
-            size_line, buffer = buffer.split(b"\r\n", 1)
-            try:
-                chunk_size = int(size_line.split(b";")[0].strip(), 16)
-            except ValueError:
-                raise IcapProtocolError(f"Invalid chunk size in response: {size_line!r}") from None
-
-            if chunk_size == 0:
-                break
+        try:
+            while True:
+                consumed, finished = self._decode_chunked(buffer, body)
+                if finished:
+                    break
+                del buffer[:consumed]
+
+                # Read exactly what the partial chunk at the front still needs
+                line_end = buffer.find(b"\r\n")
+                chunk_size = 0
+                if line_end != -1:
+                    chunk_size = self._parse_chunk_size(bytes(buffer[:line_end]))
+                if chunk_size:
+                    # Rest of the chunk data plus its trailing CRLF
+                    read = reader.readexactly(line_end + 2 + chunk_size + 2 - len(buffer))
+                else:
+                    # Partial size line or trailer; reading up to LF completes a CRLF line
+                    read = reader.readuntil(b"\n")
+                buffer += await asyncio.wait_for(read, self._timeout)
+        except asyncio.IncompleteReadError:
+            raise IcapProtocolError("Connection closed before chunked body complete") from None
+        except asyncio.LimitOverrunError:
+            raise IcapProtocolError("Chunk size line exceeds the stream buffer limit") from None
+        except asyncio.TimeoutError:
+            raise IcapTimeoutError(
+                f"Timeout reading chunked body from {self.host}:{self.port}"
+            ) from None
 
-            # Read chunk data
-            while len(buffer) < chunk_size + 2:
-                try:
-                    chunk = await asyncio.wait_for(
-                        self._reader.read(self.BUFFER_SIZE),
-                        timeout=self._timeout,
-                    )
-                    if not chunk:
-                        raise IcapProtocolError("Connection closed before chunked body complete")
-                    buffer += chunk
-                except asyncio.TimeoutError:
-                    raise IcapTimeoutError(
-                        f"Timeout reading chunked body from {self.host}:{self.port}"
-                    ) from None
-
-            body += buffer[:chunk_size]
-            buffer = buffer[chunk_size + 2 :]
-
-        return body
+        return bytes(body)
 
     async def _send_with_preview(
         self, request: bytes, body: bytes, preview_size: int
@@ -795,30 +744,14 @@ async def _send_with_preview(
             raise IcapConnectionError("Not connected to ICAP server")
 
         try:
-            # Determine preview and remainder portions
-            preview_data = body[:preview_size]
-            remainder_data = body[preview_size:]
-            is_complete = len(body) <= preview_size
-
             logger.debug(
-                f"Sending preview: {len(preview_data)} bytes, "
-                f"remainder: {len(remainder_data)} bytes, "
-                f"complete in preview: {is_complete}"
+                f"Sending preview: {min(len(body), preview_size)} bytes, "
+                f"remainder: {max(len(body) - preview_size, 0)} bytes, "
+                f"complete in preview: {len(body) <= preview_size}"
             )
 
-            # Build the preview chunk
-            # Per RFC 3507 Section 4.5, use "ieof" extension on the zero-length
-            # terminator chunk when the entire body fits in preview
-            preview_chunk = self._encode_chunked(preview_data)
-            if is_complete:
-                # Use ieof on zero-length chunk to indicate no more data
-                preview_chunk += b"0; ieof\r\n\r\n"
-            else:
-                # Normal zero-length terminator for preview section
-                preview_chunk += self._encode_chunk_terminator()
-
-            # Send request with preview
-            self._writer.write(request + preview_chunk)
+            # Send request with preview in a single write
+            self._writer.write(self._build_preview_request(request, body, preview_size))
             await asyncio.wait_for(self._writer.drain(), timeout=self._timeout)
 
             # Receive initial response (could be 100 Continue, 204, or 200)
@@ -829,12 +762,8 @@ async def _send_with_preview(
             if response.status_code == 100:
                 logger.debug("Received 100 Continue, sending remainder of body")
 
-                # Send the remainder of the body
-                if remainder_data:
-                    self._writer.write(self._encode_chunked(remainder_data))
-
-                # Send final zero-length chunk
-                self._writer.write(self._encode_chunk_terminator())
+                # Send the remainder of the body and the final zero-length chunk
+                self._writer.write(self._build_preview_remainder(body, preview_size))
                 await asyncio.wait_for(self._writer.drain(), timeout=self._timeout)
 
                 # Receive final response
@@ -842,10 +771,7 @@ async def _send_with_preview(
                 response = IcapResponse.parse(response_data)
 
             # Check for server errors
-            if 500 <= response.status_code < 600:
-                raise IcapServerError(
-                    f"ICAP server error: {response.status_code} {response.status_message}"
-                )
+            self._raise_for_status(response)
 
             logger.debug(f"Preview response: {response.status_code} {response.status_message}")
             return response
@@ -1,11 +1,12 @@
 import logging
+import os
 import socket
 import ssl
 from pathlib import Path
-from typing import Any, BinaryIO, Dict, Iterator, Optional, Union
+from typing import Any, BinaryIO, Dict, Iterator, Optional, Tuple, Union
 
 from ._protocol import IcapProtocol
-from .exception import IcapConnectionError, IcapProtocolError, IcapServerError, IcapTimeoutError
+from .exception import IcapConnectionError, IcapProtocolError, IcapTimeoutError
 from .response import IcapResponse
 
 logger = logging.getLogger(__name__)
@@ -106,6 +107,8 @@ def __init__(
         self._ssl_context: Optional[ssl.SSLContext] = ssl_context
         self._socket: Optional[Union[socket.socket, ssl.SSLSocket]] = None
         self._connected: bool = False
+        # Receive buffer reused by every recv_into() call on this client
+        self._recv_buffer: memoryview = memoryview(bytearray(self.BUFFER_SIZE))
         logger.debug(
             f"Initialized IcapClient for {address}:{port} (SSL: {ssl_context is not None})"
         )
@@ -150,6 +153,8 @@ def connect(self) -> None:
             sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
             sock.settimeout(self._timeout)
             sock.connect((self.host, self.port))
+            # Every message is written whole, so there is nothing for Nagle to coalesce
+            sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
 
             # Wrap socket with SSL/TLS if ssl_context is provided
             if self._ssl_context is not None:
@@ -401,8 +406,78 @@ def scan_file(self, filepath: Union[str, Path], service: str = "avscan") -> Icap
             raise FileNotFoundError(f"File not found: {filepath}")
 
         with open(filepath, "rb") as f:
+            if self._ssl_context is None:
+                return self._scan_file_sendfile(f, service, filepath.name)
             return self.scan_stream(f, service=service, filename=filepath.name)
 
+    def _scan_file_sendfile(self, file: BinaryIO, service: str, filename: str) -> IcapResponse:
+        """
+        Scan an open file, letting the kernel copy its contents to the socket.
+
+        The body is sent as a single chunk with socket.sendfile(), so the file
+        is never read into Python memory. Only used on plain TCP connections,
+        where sendfile() can hand the file descriptor straight to the kernel.
+
+        Args:
+            file: File opened in binary mode
+            service: ICAP service name
+            filename: Filename for HTTP headers
+
+        Returns:
+            IcapResponse object
+        """
+        if not self._connected:
+            self.connect()
+
+        if self._socket is None:
+            raise IcapConnectionError("Not connected to ICAP server")
+
+        size = os.fstat(file.fileno()).st_size
+        logger.info(f"Scanning file ({size} bytes) - {filename}")
+
+        request_line = (
+            f"RESPMOD icap://{self.host}:{self.port}/{service} {self.ICAP_VERSION}{self.CRLF}"
+        )
+
+        # Same encapsulated layout as scan_bytes(): a Content-Length HTTP response
+        http_request = self._build_http_request_header(filename)
+        http_response_headers = self._build_http_response_header(size)
+        req_hdr_len = len(http_request)
+        res_body_offset = req_hdr_len + len(http_response_headers)
+
+        icap_headers = {
+            "Host": f"{self.host}:{self.port}",
+            "User-Agent": "Python-ICAP-Client/1.0",
+            "Allow": "204",
+            "Encapsulated": f"req-hdr=0, res-hdr={req_hdr_len}, res-body={res_body_offset}",
+        }
+
+        icap_request = self._build_request(request_line, icap_headers)
+        icap_request += http_request
+        icap_request += http_response_headers
+
+        try:
+            if size:
+                self._socket.sendall(icap_request + self._chunk_header(size))
+                sent = self._socket.sendfile(file, 0, size)
+                if sent != size:
+                    # The chunk size is already on the wire, so the connection is unusable
+                    self.disconnect()
+                    raise IcapProtocolError(
+                        f"File changed while being sent: expected {size} bytes, sent {sent}"
+                    )
+                self._socket.sendall(b"\r\n" + self._encode_chunk_terminator())
+            else:
+                self._socket.sendall(icap_request + self._encode_chunk_terminator())
+
+            return self._receive_response()
+
+        except socket.timeout as e:
+            raise IcapTimeoutError(f"Request to {self.host}:{self.port} timed out") from e
+        except OSError as e:
+            self._connected = False
+            raise IcapConnectionError(f"Connection error with {self.host}:{self.port}: {e}") from e
+
     def scan_stream(
         self,
         stream: BinaryIO,
@@ -505,12 +580,9 @@ def _scan_stream_chunked(
             self._socket.sendall(icap_request)
 
             total_bytes = 0
-            for chunk in self._iter_chunks(stream, chunk_size):
-                chunk_header = f"{len(chunk):X}\r\n".encode()
-                self._socket.sendall(chunk_header)
-                self._socket.sendall(chunk)
-                self._socket.sendall(b"\r\n")
-                total_bytes += len(chunk)
+            for frame, payload_size in self._iter_chunk_frames(stream, chunk_size):
+                self._socket.sendall(frame)
+                total_bytes += payload_size
 
             self._socket.sendall(self._encode_chunk_terminator())
             logger.debug(f"Sent {total_bytes} bytes in chunked encoding")
@@ -535,53 +607,94 @@ def _iter_chunks(self, stream: BinaryIO, chunk_size: int) -> Iterator[bytes]:
                 break
             yield chunk
 
+    def _iter_chunk_frames(
+        self, stream: BinaryIO, chunk_size: int
+    ) -> Iterator[Tuple[Union[bytes, memoryview], int]]:
+        """Iterate over a stream as chunk-encoded frames (size line, data, CRLF).
+
+        Streams that support readinto() are read straight into a single reusable
+        frame buffer that leaves room in front for the size line, so each frame is
+        yielded as one memoryview that is only valid until the next one is
+        requested. Other streams are read with _iter_chunks() and encoded per chunk.
+
+        Yields:
+            Tuples of (frame, number of payload bytes in the frame)
+        """
+        readinto = getattr(stream, "readinto", None)
+        if readinto is None:
+            for chunk in self._iter_chunks(stream, chunk_size):
+                yield self._encode_chunked(chunk), len(chunk)
+            return
+
+        # The size line of a full chunk is the longest one a frame can need
+        header_room = len(self._chunk_header(chunk_size))
+        frame = memoryview(bytearray(header_room + chunk_size + 2))
+        data = frame[header_room : header_room + chunk_size]
+        while True:
+            try:
+                n = readinto(data)
+            except OSError as e:
+                raise IcapProtocolError(f"Failed to read from stream: {e}") from e
+            if not n:
+                break
+            header = self._chunk_header(n)
+            start = header_room - len(header)
+            frame[start:header_room] = header
+            frame[header_room + n : header_room + n + 2] = b"\r\n"
+            yield frame[start : header_room + n + 2], n
+
     def _receive_response(self) -> IcapResponse:
-        """Receive and parse ICAP response from the socket."""
+        """Receive and parse ICAP response from the socket.
+
+        Raises:
+            IcapConnectionError: If not connected or connection is lost.
+            IcapTimeoutError: If the operation times out.
+            IcapProtocolError: If the response cannot be parsed.
+            IcapServerError: If the server returns a 5xx error.
+        """
         if self._socket is None:
             raise IcapConnectionError("Not connected to ICAP server")
 
         try:
-            response_data = b""
+            # Receive into the client's reusable buffer and append to one growing
+            # bytearray, instead of allocating a new bytes object per recv
+            response_data = bytearray()
+            scratch = self._recv_buffer
             header_end_marker = b"\r\n\r\n"
+            header_end = -1
 
-            # Read until we get the complete headers
-            while header_end_marker not in response_data:
-                chunk = self._socket.recv(self.BUFFER_SIZE)
-                if not chunk:
+            # Read until we get the complete headers, only searching the new data
+            while header_end == -1:
+                n = self._socket.recv_into(scratch)
+                if not n:
                     break
-                response_data += chunk
-
-            # Parse headers to determine if there's a body
-            if header_end_marker in response_data:
-                header_section, body_start = response_data.split(header_end_marker, 1)
-                headers_str = header_section.decode("utf-8", errors="ignore")
-
-                content_length = None
-                for line in headers_str.split("\r\n")[1:]:
-                    if ":" in line:
-                        key, value = line.split(":", 1)
-                        if key.strip().lower() == "content-length":
-                            try:
-                                content_length = int(value.strip())
-                            except ValueError:
-                                raise IcapProtocolError(
-                                    f"Invalid Content-Length header: {value.strip()!r}"
-                                ) from None
-                            break
+                search_start = max(0, len(response_data) - len(header_end_marker) + 1)
+                response_data += scratch[:n]
+                header_end = response_data.find(header_end_marker, search_start)
+
+            # Parse headers to determine if there's a body and how to read it
+            if header_end != -1:
+                body_offset = header_end + len(header_end_marker)
+                content_length, is_chunked = self._parse_body_framing(
+                    bytes(response_data[:header_end])
+                )
 
                 if content_length is not None:
-                    response_data = header_section + header_end_marker
-                    bytes_read = len(body_start)
-                    response_data += body_start
+                    # Read exactly Content-Length bytes
+                    logger.debug(f"Reading {content_length} bytes of body content")
+                    bytes_read = len(response_data) - body_offset
 
+                    # Receive the rest in bounded reads through the scratch buffer, so
+                    # memory only grows as body bytes actually arrive rather than
+                    # trusting the advertised length up front
                     while bytes_read < content_length:
-                        chunk = self._socket.recv(
-                            min(self.BUFFER_SIZE, content_length - bytes_read)
+                        n = self._socket.recv_into(
+                            scratch, min(len(scratch), content_length - bytes_read)
                         )
-                        if not chunk:
+                        if not n:
                             break
-                        response_data += chunk
-                        bytes_read += len(chunk)
+                        response_data += scratch[:n]
+                        bytes_read += n
 
                     # Validate we received all expected bytes
                     if bytes_read < content_length:
@@ -589,6 +702,17 @@ def _receive_response(self) -> IcapResponse:
                             f"Incomplete response: expected {content_length} bytes, got {bytes_read}"
                         )
 
+                elif is_chunked:
+                    # Read chunked transfer encoding
+                    logger.debug("Reading chunked response body")
+                    body_start = bytes(response_data[body_offset:])
+                    del response_data[body_offset:]
+                    response_data += self._read_chunked_body(body_start)
+
+                else:
+                    # For responses without Content-Length (like 204), headers are enough
+                    logger.debug("No Content-Length header, using headers only")
+
             logger.debug(f"Received {len(response_data)} bytes from ICAP server")
 
         except socket.timeout as e:
@@ -598,14 +722,12 @@ def _receive_response(self) -> IcapResponse:
             raise IcapConnectionError(f"Connection error with {self.host}:{self.port}: {e}") from e
 
         try:
-            response = IcapResponse.parse(response_data)
+            response = IcapResponse.parse(bytes(response_data))
         except ValueError as e:
             raise IcapProtocolError(f"Failed to parse ICAP response: {e}") from e
 
-        if 500 <= response.status_code < 600:
-            raise IcapServerError(
-                f"ICAP server error: {response.status_code} {response.status_message}"
-            )
+        # Check for server errors
+        self._raise_for_status(response)
 
         return response
 
@@ -653,94 +775,13 @@ def _send_and_receive(self, request: bytes) -> IcapResponse:
         try:
             logger.debug(f"Sending {len(request)} bytes to ICAP server")
             self._socket.sendall(request)
-
-            # Receive response headers first
-            response_data = b""
-            header_end_marker = b"\r\n\r\n"
-
-            # Read until we get the complete headers
-            while header_end_marker not in response_data:
-                chunk = self._socket.recv(self.BUFFER_SIZE)
-                if not chunk:
-                    break
-                response_data += chunk
-
-            # Parse headers to determine if there's a body and how to read it
-            if header_end_marker in response_data:
-                header_section, body_start = response_data.split(header_end_marker, 1)
-                headers_str = header_section.decode("utf-8", errors="ignore")
-
-                # Parse headers into dict for easier lookup
-                content_length = None
-                is_chunked = False
-                for line in headers_str.split("\r\n")[1:]:
-                    if ":" in line:
-                        key, value = line.split(":", 1)
-                        key_lower = key.strip().lower()
-                        value_stripped = value.strip().lower()
-                        if key_lower == "content-length":
-                            try:
-                                content_length = int(value.strip())
-                            except ValueError:
-                                raise IcapProtocolError(
-                                    f"Invalid Content-Length header: {value.strip()!r}"
-                                ) from None
-                        elif key_lower == "transfer-encoding" and "chunked" in value_stripped:
-                            is_chunked = True
-
-                if content_length is not None:
-                    # Read exactly Content-Length bytes
-                    logger.debug(f"Reading {content_length} bytes of body content")
-                    response_data = header_section + header_end_marker
-                    bytes_read = len(body_start)
-                    response_data += body_start
-
-                    while bytes_read < content_length:
-                        chunk = self._socket.recv(
-                            min(self.BUFFER_SIZE, content_length - bytes_read)
-                        )
-                        if not chunk:
-                            break
-                        response_data += chunk
-                        bytes_read += len(chunk)
-
-                    # Validate we received all expected bytes
-                    if bytes_read < content_length:
-                        raise IcapProtocolError(
-                            f"Incomplete response: expected {content_length} bytes, got {bytes_read}"
-                        )
-
-                elif is_chunked:
-                    # Read chunked transfer encoding
-                    logger.debug("Reading chunked response body")
-                    response_data = header_section + header_end_marker
-                    chunked_body = self._read_chunked_body(body_start)
-                    response_data += chunked_body
-
-                else:
-                    # For responses without Content-Length (like 204), headers are enough
-                    logger.debug("No Content-Length header, using headers only")
-
-            logger.debug(f"Received {len(response_data)} bytes from ICAP server")
-
         except socket.timeout as e:
             raise IcapTimeoutError(f"Request to {self.host}:{self.port} timed out") from e
         except OSError as e:
             self._connected = False
             raise IcapConnectionError(f"Connection error with {self.host}:{self.port}: {e}") from e
 
-        try:
-            response = IcapResponse.parse(response_data)
-        except ValueError as e:
-            raise IcapProtocolError(f"Failed to parse ICAP response: {e}") from e
-
-        # Check for server errors
-        if 500 <= response.status_code < 600:
-            raise IcapServerError(
-                f"ICAP server error: {response.status_code} {response.status_message}"
-            )
-
-        return response
+        return self._receive_response()
 
     def _read_chunked_body(self, initial_data: bytes) -> bytes:
         """Read a chunked transfer encoded body from the socket.
@@ -754,41 +795,24 @@ def _read_chunked_body(self, initial_data: bytes) -> bytes:
         if self._socket is None:
             raise IcapConnectionError("Not connected to ICAP server")
 
-        buffer = initial_data
-        body = b""
+        buffer = bytearray(initial_data)
+        body = bytearray()
+        scratch = self._recv_buffer
 
         while True:
-            # Ensure we have enough data to read the chunk size line
-            while b"\r\n" not in buffer:
-                chunk = self._socket.recv(self.BUFFER_SIZE)
-                if not chunk:
-                    raise IcapProtocolError("Connection closed before chunked body complete")
-                buffer += chunk
-
-            # Parse chunk size (hex)
-            size_line, buffer = buffer.split(b"\r\n", 1)
-            try:
-                # Chunk size may have extensions after semicolon, ignore them
-                chunk_size = int(size_line.split(b";")[0].strip(), 16)
-            except ValueError:
-                raise IcapProtocolError(f"Invalid chunk size in response: {size_line!r}") from None
-
-            if chunk_size == 0:
-                # Final chunk - read trailing CRLF
+            consumed, finished = self._decode_chunked(buffer, body)
+            if finished:
                 break
 
-            # Read chunk data
-            while len(buffer) < chunk_size + 2:  # +2 for trailing CRLF
-                chunk = self._socket.recv(self.BUFFER_SIZE)
-                if not chunk:
-                    raise IcapProtocolError("Connection closed before chunked body complete")
-                buffer += chunk
+            # Drop the decoded prefix in place; bytearray advances its start
+            # offset instead of copying, so only the undecoded tail is retained
+            del buffer[:consumed]
+            n = self._socket.recv_into(scratch)
+            if not n:
+                raise IcapProtocolError("Connection closed before chunked body complete")
+            buffer += scratch[:n]
 
-            # Extract chunk data (excluding trailing CRLF)
-            body += buffer[:chunk_size]
-            buffer = buffer[chunk_size + 2 :]  # Skip chunk data and CRLF
-
-        return body
+        return bytes(body)
 
     def _send_with_preview(self, request: bytes, body: bytes, preview_size: int) -> IcapResponse:
         """Send an ICAP request with preview mode.
@@ -809,30 +833,14 @@ def _send_with_preview(self, request: bytes, body: bytes, preview_size: int) ->
             raise IcapConnectionError("Not connected to ICAP server")
 
         try:
-            # Determine preview and remainder portions
-            preview_data = body[:preview_size]
-            remainder_data = body[preview_size:]
-            is_complete = len(body) <= preview_size
-
             logger.debug(
-                f"Sending preview: {len(preview_data)} bytes, "
-                f"remainder: {len(remainder_data)} bytes, "
-                f"complete in preview: {is_complete}"
+                f"Sending preview: {min(len(body), preview_size)} bytes, "
+                f"remainder: {max(len(body) - preview_size, 0)} bytes, "
+                f"complete in preview: {len(body) <= preview_size}"
             )
 
-            # Build the preview chunk
-            # Per RFC 3507 Section 4.5, use "ieof" extension on the zero-length
-            # terminator chunk when the entire body fits in preview
-            preview_chunk = self._encode_chunked(preview_data)
-            if is_complete:
-                # Use ieof on zero-length chunk to indicate no more data
-                preview_chunk += b"0; ieof\r\n\r\n"
-            else:
-                # Normal zero-length terminator for preview section
-                preview_chunk += self._encode_chunk_terminator()
-
-            # Send request with preview
-            self._socket.sendall(request + preview_chunk)
+            # Send request with preview in a single write
+            self._socket.sendall(self._build_preview_request(request, body, preview_size))
 
             # Receive initial response (could be 100 Continue, 204, or 200)
             response = self._receive_response()
@@ -841,12 +849,8 @@ def _send_with_preview(self, request: bytes, body: bytes, preview_size: int) ->
             if response.status_code == 100:
                 logger.debug("Received 100 Continue, sending remainder of body")
 
-                # Send the remainder of the body
-                if remainder_data:
-                    self._socket.sendall(self._encode_chunked(remainder_data))
-
-                # Send final zero-length chunk
-                self._socket.sendall(self._encode_chunk_terminator())
+                # Send the remainder of the body and the final zero-length chunk
+                self._socket.sendall(self._build_preview_remainder(body, preview_size))
 
                 # Receive final response
                 response = self._receive_response()
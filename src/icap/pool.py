@@ -0,0 +1,224 @@
+"""Connection pool for the sync ICAP client."""
+
+import logging
+import select
+import ssl
+import threading
+from collections import deque
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any, BinaryIO, Deque, Dict, Iterator, Optional, Union
+
+from ._protocol import IcapProtocol
+from .icap import IcapClient
+from .response import IcapResponse
+
+logger = logging.getLogger(__name__)
+
+
+class IcapClientPool:
+    """
+    Thread-safe pool of connected IcapClient instances for a single ICAP server.
+
+    Each scan borrows an idle, already-connected client instead of opening a
+    new connection, so the TCP (and TLS) handshake is paid once per pooled
+    connection rather than once per scan. Clients are created on demand; at
+    most ``size`` idle connections are kept, any extra are closed on release.
+
+    A client that raised during use is disconnected rather than returned to
+    the pool, and an idle connection the server has closed (or sent
+    unexpected data on) is discarded the next time it would be handed out.
+
+    Example:
+        >>> from icap import IcapClientPool
+        >>>
+        >>> with IcapClientPool('localhost', size=4) as pool:
+        ...     response = pool.scan_bytes(b"content")
+        ...     print(f"Clean: {response.is_no_modification}")
+        ...
+        ...     # Borrow a client for several requests on one connection
+        ...     with pool.client() as client:
+        ...         client.options('avscan')
+        ...         client.scan_file('/path/to/file.pdf')
+
+    See Also:
+        - IcapClient: The client type handed out by the pool
+    """
+
+    def __init__(
+        self,
+        address: str,
+        port: int = IcapProtocol.DEFAULT_PORT,
+        timeout: int = 10,
+        ssl_context: Optional[ssl.SSLContext] = None,
+        size: int = 8,
+    ) -> None:
+        """
+        Initialize the pool. No connections are opened until first use.
+
+        Args:
+            address: ICAP server hostname or IP address
+            port: ICAP server port (default: 1344)
+            timeout: Socket timeout in seconds for each client (default: 10)
+            ssl_context: Optional SSL context passed to each client for TLS
+            size: Maximum number of idle connections kept open (default: 8)
+
+        Raises:
+            ValueError: If size is less than 1.
+        """
+        if size < 1:
+            raise ValueError("pool size must be a positive integer")
+        self._address = address
+        self._port = port
+        self._timeout = timeout
+        self._ssl_context = ssl_context
+        self._size = size
+        self._idle: Deque[IcapClient] = deque()
+        self._lock = threading.Lock()
+
+    @property
+    def size(self) -> int:
+        """Maximum number of idle connections kept open."""
+        return self._size
+
+    def acquire(self) -> IcapClient:
+        """
+        Take a connected client from the pool, connecting a new one if none is idle.
+
+        The caller owns the client until it is handed back with release().
+
+        Raises:
+            IcapConnectionError: If a new connection cannot be established.
+            IcapTimeoutError: If connecting times out.
+        """
+        while True:
+            with self._lock:
+                client = self._idle.pop() if self._idle else None
+            if client is None:
+                break
+            if self._is_reusable(client):
+                return client
+            logger.debug("Discarding stale pooled ICAP connection")
+            client.disconnect()
+
+        client = IcapClient(
+            self._address, port=self._port, timeout=self._timeout, ssl_context=self._ssl_context
+        )
+        client.connect()
+        return client
+
+    def release(self, client: IcapClient) -> None:
+        """
+        Return a client to the pool, or close it if it is disconnected or the pool is full.
+
+        Args:
+            client: A client previously returned by acquire()
+        """
+        if client.is_connected:
+            with self._lock:
+                if len(self._idle) < self._size:
+                    self._idle.append(client)
+                    return
+        client.disconnect()
+
+    @contextmanager
+    def client(self) -> Iterator[IcapClient]:
+        """
+        Borrow a client for the duration of a ``with`` block.
+
+        The client goes back to the pool when the block exits normally, and is
+        disconnected instead if the block raises, since the connection may be
+        left mid-message.
+        """
+        client = self.acquire()
+        try:
+            yield client
+        except BaseException:
+            client.disconnect()
+            raise
+        self.release(client)
+
+    def close(self) -> None:
+        """Disconnect every idle client. Clients currently borrowed are unaffected."""
+        with self._lock:
+            idle = list(self._idle)
+            self._idle.clear()
+        for client in idle:
+            client.disconnect()
+
+    def options(self, service: str) -> IcapResponse:
+        """Send an OPTIONS request on a pooled connection. See IcapClient.options()."""
+        with self.client() as client:
+            return client.options(service)
+
+    def respmod(
+        self,
+        service: str,
+        http_request: bytes,
+        http_response: bytes,
+        headers: Optional[Dict[str, str]] = None,
+        preview: Optional[int] = None,
+    ) -> IcapResponse:
+        """Send a RESPMOD request on a pooled connection. See IcapClient.respmod()."""
+        with self.client() as client:
+            return client.respmod(service, http_request, http_response, headers, preview)
+
+    def reqmod(
+        self,
+        service: str,
+        http_request: bytes,
+        http_body: Optional[bytes] = None,
+        headers: Optional[Dict[str, str]] = None,
+    ) -> IcapResponse:
+        """Send a REQMOD request on a pooled connection. See IcapClient.reqmod()."""
+        with self.client() as client:
+            return client.reqmod(service, http_request, http_body, headers)
+
+    def scan_bytes(
+        self, data: bytes, service: str = "avscan", filename: Optional[str] = None
+    ) -> IcapResponse:
+        """Scan bytes on a pooled connection. See IcapClient.scan_bytes()."""
+        with self.client() as client:
+            return client.scan_bytes(data, service=service, filename=filename)
+
+    def scan_file(self, filepath: Union[str, Path], service: str = "avscan") -> IcapResponse:
+        """Scan a file on a pooled connection. See IcapClient.scan_file()."""
+        with self.client() as client:
+            return client.scan_file(filepath, service=service)
+
+    def scan_stream(
+        self,
+        stream: BinaryIO,
+        service: str = "avscan",
+        filename: Optional[str] = None,
+        chunk_size: int = 0,
+    ) -> IcapResponse:
+        """Scan a file-like object on a pooled connection. See IcapClient.scan_stream()."""
+        with self.client() as client:
+            return client.scan_stream(
+                stream, service=service, filename=filename, chunk_size=chunk_size
+            )
+
+    @staticmethod
+    def _is_reusable(client: IcapClient) -> bool:
+        """Return True if an idle client's connection still looks usable.
+
+        An idle ICAP connection should have nothing to read; if it is readable
+        the server has either closed it or sent data nobody asked for.
+        """
+        if not client.is_connected or client._socket is None:
+            return False
+        try:
+            readable, _, _ = select.select([client._socket], [], [], 0)
+        except (OSError, ValueError):
+            return False
+        return not readable
+
+    def __enter__(self) -> "IcapClientPool":
+        """Context manager entry."""
+        return self
+
+    def __exit__(self, exc_type: Any, exc_val: Any, exc_tb: Any) -> bool:
+        """Context manager exit. Closes all idle connections."""
+        self.close()
+        return False
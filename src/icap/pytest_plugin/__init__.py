@@ -286,7 +286,7 @@ def icap_service_config() -> dict[str, Any]:
     }
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_clean_content() -> bytes:
     """Provide sample clean content for testing."""
     return b"This is clean test content for ICAP scanning."
@@ -459,6 +459,10 @@ def icap_mock(request) -> Generator[MockIcapClient, None, None]:
         Stack multiple markers to define a sequence of responses consumed in order.
         Responses are queued top-to-bottom as written in the source.
 
+    The icap_mock configuration can also be supplied by indirect
+    parametrization, with each parameter a dict of the same keyword arguments
+    the marker accepts. A parameter takes precedence over an icap_mock marker.
+
     Examples - icap_mock marker:
         @pytest.mark.icap_mock(response="clean")
         def test_clean(icap_mock):
@@ -493,10 +497,22 @@ def test_named_virus(icap_mock):
         def test_custom_error(icap_mock):
             response = icap_mock.scan_bytes(b"file")
             assert response.status_code == 503
+
+    Examples - Indirect parametrization:
+        @pytest.mark.parametrize(
+            "icap_mock",
+            [{"response": "clean"}, {"response": "virus"}],
+            indirect=True,
+        )
+        def test_each_outcome(icap_mock):
+            icap_mock.scan_bytes(b"file")
     """
-    # Check for strict mode from marker
-    marker = request.node.get_closest_marker("icap_mock")
-    strict = marker.kwargs.get("strict", False) if marker else False
+    # Configuration comes from indirect parametrization, else the icap_mock marker
+    config = getattr(request, "param", None)
+    if config is None:
+        marker = request.node.get_closest_marker("icap_mock")
+        config = marker.kwargs if marker else None
+    strict = config.get("strict", False) if config else False
 
     client = MockIcapClient(strict=strict)
 
@@ -509,18 +525,16 @@ def test_custom_error(icap_mock):
         client.on_respmod(*responses)
 
     # Also handle @pytest.mark.icap_mock configuration
-    if marker is None:
+    if config is None:
         yield client
         return
 
     # Handle simple response configuration
-    response_type = marker.kwargs.get("response")
-    virus_name = marker.kwargs.get("virus_name", "EICAR-Test-Signature")
-    raises = marker.kwargs.get("raises")
+    response_type = config.get("response")
+    virus_name = config.get("virus_name", "EICAR-Test-Signature")
+    raises = config.get("raises")
 
     if raises is not None:
-        if isinstance(raises, type) and issubclass(raises, Exception):
-            raises = raises("Mock exception")
         client.on_any(raises=raises)
     elif response_type == "clean":
         client.on_any(IcapResponseBuilder().clean().build())
@@ -533,14 +547,11 @@ def test_custom_error(icap_mock):
 
     # Handle per-method configuration
     for method in ("options", "respmod", "reqmod"):
-        method_config = marker.kwargs.get(method)
+        method_config = config.get(method)
         if method_config:
             configure_method = getattr(client, f"on_{method}")
             if "raises" in method_config:
-                exc = method_config["raises"]
-                if isinstance(exc, type) and issubclass(exc, Exception):
-                    exc = exc("Mock exception")
-                configure_method(raises=exc)
+                configure_method(raises=method_config["raises"])
             elif "response" in method_config:
                 resp = method_config["response"]
                 if resp == "clean":
@@ -796,9 +796,15 @@ def __init__(
         }
 
         # Default responses (clean/success) - used when queue mode is not active
-        self._options_response: IcapResponse | Exception = IcapResponseBuilder().options().build()
-        self._respmod_response: IcapResponse | Exception = IcapResponseBuilder().clean().build()
-        self._reqmod_response: IcapResponse | Exception = IcapResponseBuilder().clean().build()
+        self._options_response: IcapResponse | Exception | type[Exception] = (
+            IcapResponseBuilder().options().build()
+        )
+        self._respmod_response: IcapResponse | Exception | type[Exception] = (
+            IcapResponseBuilder().clean().build()
+        )
+        self._reqmod_response: IcapResponse | Exception | type[Exception] = (
+            IcapResponseBuilder().clean().build()
+        )
 
         # Callbacks for dynamic response generation
         self._callbacks: dict[str, ResponseCallback | AsyncResponseCallback | None] = {
@@ -815,7 +821,7 @@ def __init__(
     def on_options(
         self,
         *responses: IcapResponse | Exception,
-        raises: Exception | None = None,
+        raises: Exception | type[Exception] | None = None,
     ) -> MockIcapClient:
         """
         Configure what the OPTIONS method returns.
@@ -829,7 +835,8 @@ def on_options(
         Args:
             *responses: One or more IcapResponse objects (or Exceptions).
                         If multiple provided, they form a queue consumed in order.
-            raises: Exception to raise on all calls. Takes precedence over responses.
+            raises: Exception instance or class to raise on all calls. A class is
+                    instantiated on each call. Takes precedence over responses.
 
         Returns:
             Self for method chaining.
@@ -882,7 +889,7 @@ def on_options(
     def on_respmod(
         self,
         *responses: IcapResponse | Exception,
-        raises: Exception | None = None,
+        raises: Exception | type[Exception] | None = None,
         callback: ResponseCallback | None = None,
     ) -> MockIcapClient:
         """
@@ -901,7 +908,8 @@ def on_respmod(
         Args:
             *responses: One or more IcapResponse objects (or Exceptions).
                         If multiple provided, they form a queue consumed in order.
-            raises: Exception to raise on all calls. Takes precedence over responses.
+            raises: Exception instance or class to raise on all calls. A class is
+                    instantiated on each call. Takes precedence over responses.
             callback: Function called with (data, service=, filename=, **kwargs)
                       that returns an IcapResponse. Used for dynamic responses.
                       Takes precedence over responses and raises.
@@ -980,7 +988,7 @@ def on_respmod(
     def on_reqmod(
         self,
         *responses: IcapResponse | Exception,
-        raises: Exception | None = None,
+        raises: Exception | type[Exception] | None = None,
     ) -> MockIcapClient:
         """
         Configure what the REQMOD method returns.
@@ -994,7 +1002,8 @@ def on_reqmod(
         Args:
             *responses: One or more IcapResponse objects (or Exceptions).
                         If multiple provided, they form a queue consumed in order.
-            raises: Exception to raise on all calls. Takes precedence over responses.
+            raises: Exception instance or class to raise on all calls. A class is
+                    instantiated on each call. Takes precedence over responses.
 
         Returns:
             Self for method chaining.
@@ -1045,7 +1054,7 @@ def on_any(
         self,
         response: IcapResponse | None = None,
         *,
-        raises: Exception | None = None,
+        raises: Exception | type[Exception] | None = None,
     ) -> MockIcapClient:
         """
         Configure all methods (OPTIONS, RESPMOD, REQMOD) at once.
@@ -1055,7 +1064,8 @@ def on_any(
 
         Args:
             response: IcapResponse to return from all methods.
-            raises: Exception to raise from all methods. Takes precedence.
+            raises: Exception instance or class to raise from all methods.
+                    Takes precedence.
 
         Returns:
             Self for method chaining.
@@ -1771,7 +1781,7 @@ def _record_call(self, method: str, **kwargs: Any) -> MockCall:
 
     def _get_response_with_metadata(
         self, method: str, call_kwargs: dict[str, Any]
-    ) -> tuple[IcapResponse | Exception, str]:
+    ) -> tuple[IcapResponse | Exception | type[Exception], str]:
         """
         Get the next response and metadata for the given method.
 
@@ -1814,7 +1824,7 @@ def _get_response_with_metadata(
                 f"Configure more responses with on_{method}() or use reset_responses()."
             )
 
-        default_responses: dict[str, IcapResponse | Exception] = {
+        default_responses: dict[str, IcapResponse | Exception | type[Exception]] = {
             "options": self._options_response,
             "respmod": self._respmod_response,
             "reqmod": self._reqmod_response,
@@ -1846,6 +1856,10 @@ def _execute_call(self, call: MockCall, response_method: str) -> IcapResponse:
             )
             call.matched_by = matched_by
 
+            if isinstance(response_or_exception, type):
+                # raises= given as a class: raise a fresh instance on every call
+                response_or_exception = response_or_exception("Mock exception")
+
             if isinstance(response_or_exception, Exception):
                 call.exception = response_or_exception
                 raise response_or_exception
@@ -2001,7 +2015,7 @@ class MockAsyncIcapClient(MockIcapClient):
 
     async def _get_response_with_metadata_async(
         self, method: str, call_kwargs: dict[str, Any]
-    ) -> tuple[IcapResponse | Exception, str]:
+    ) -> tuple[IcapResponse | Exception | type[Exception], str]:
         """
         Get the next response and metadata for the given method (async version).
 
@@ -2050,7 +2064,7 @@ async def _get_response_with_metadata_async(
                 f"Configure more responses with on_{method}() or use reset_responses()."
             )
 
-        default_responses: dict[str, IcapResponse | Exception] = {
+        default_responses: dict[str, IcapResponse | Exception | type[Exception]] = {
             "options": self._options_response,
             "respmod": self._respmod_response,
             "reqmod": self._reqmod_response,
@@ -2082,6 +2096,10 @@ async def _execute_call_async(self, call: MockCall, response_method: str) -> Ica
             )
             call.matched_by = matched_by
 
+            if isinstance(response_or_exception, type):
+                # raises= given as a class: raise a fresh instance on every call
+                response_or_exception = response_or_exception("Mock exception")
+
             if isinstance(response_or_exception, Exception):
                 call.exception = response_or_exception
                 raise response_or_exception
@@ -1,4 +1,4 @@
-from typing import Dict
+from typing import Dict, FrozenSet, Optional
 
 
 class IcapResponse:
@@ -35,6 +35,32 @@ class IcapResponse:
         ...     print(f"Threat detected: {virus}")
     """
 
+    # Status codes treated as success by is_success
+    _SUCCESS_CODES: FrozenSet[int] = frozenset(range(200, 300))
+
+    # Shared str objects for the reason phrases servers commonly send, keyed by
+    # their raw bytes so parse() can skip decoding them
+    _STATUS_MESSAGES: Dict[bytes, str] = {
+        raw.encode("ascii"): raw
+        for raw in (
+            "Continue",
+            "OK",
+            "No Content",
+            "No Modification",
+            "No Modifications",
+            "Bad Request",
+            "Forbidden",
+            "Service Not Found",
+            "Method Not Allowed",
+            "Request Timeout",
+            "Internal Server Error",
+            "Not Implemented",
+            "Bad Gateway",
+            "Service Unavailable",
+            "ICAP Version Not Supported",
+        )
+    }
+
     def __init__(self, status_code: int, status_message: str, headers: Dict[str, str], body: bytes):
         """
         Initialize ICAP response.
@@ -50,6 +76,24 @@ def __init__(self, status_code: int, status_message: str, headers: Dict[str, str
         self.headers = headers
         self.body = body
 
+    @property
+    def headers(self) -> Dict[str, str]:
+        """
+        ICAP response headers as a dictionary.
+
+        For parsed responses the header block is only split into fields on first
+        access, so callers that only check the status code never pay for it.
+        """
+        if self._headers is None:
+            self._headers = self._parse_headers(self._raw_headers)
+            self._raw_headers = b""
+        return self._headers
+
+    @headers.setter
+    def headers(self, headers: Dict[str, str]) -> None:
+        self._headers: Optional[Dict[str, str]] = headers
+        self._raw_headers = b""
+
     @property
     def is_success(self) -> bool:
         """
@@ -68,7 +112,7 @@ def is_success(self) -> bool:
             >>> if response.is_success:
             ...     print("Server responded successfully")
         """
-        return 200 <= self.status_code < 300
+        return self.status_code in self._SUCCESS_CODES
 
     @property
     def is_no_modification(self) -> bool:
@@ -103,28 +147,66 @@ def parse(cls, data: bytes) -> "IcapResponse":
         Returns:
             IcapResponse object
         """
-        parts = data.split(b"\r\n\r\n", 1)
-        header_section = parts[0].decode("utf-8", errors="ignore")
-        body = parts[1] if len(parts) > 1 else b""
-
-        lines = header_section.split("\r\n")
-        status_line = lines[0]
+        header_end = data.find(b"\r\n\r\n")
+        if header_end == -1:
+            header_end = len(data)
+            body = b""
+        else:
+            body = data[header_end + 4 :]
 
         # Expected format: ICAP/1.0 200 OK
-        status_parts = status_line.split(" ", 2)
-        if len(status_parts) < 3:
+        # Locate the two separating spaces in place rather than splitting the line
+        status_end = data.find(b"\r\n", 0, header_end)
+        if status_end == -1:
+            status_end = header_end
+        code_start = data.find(b" ", 0, status_end) + 1
+        code_end = data.find(b" ", code_start, status_end) if code_start else -1
+        if code_end == -1:
+            status_line = data[:status_end].decode("utf-8", errors="ignore")
             raise ValueError(f"Invalid ICAP status line: {status_line}")
 
-        status_code = int(status_parts[1])
-        status_message = status_parts[2]
+        # Status codes are exactly three ASCII digits
+        code = data[code_start:code_end]
+        if len(code) != 3 or not code.isdigit():
+            raise ValueError(f"Invalid ICAP status code: {code.decode('utf-8', errors='ignore')}")
+        status_code = int(code)
+        raw_message = data[code_end + 1 : status_end]
+        status_message = cls._STATUS_MESSAGES.get(raw_message)
+        if status_message is None:
+            status_message = raw_message.decode("utf-8", errors="ignore")
+
+        response = cls(status_code, status_message, {}, body)
+        # Defer header parsing until the headers are actually read
+        response._headers = None
+        response._raw_headers = data[status_end + 2 : header_end]
+        return response
+
+    @staticmethod
+    def _parse_headers(raw_headers: bytes) -> Dict[str, str]:
+        """
+        Parse raw header lines (without the status line) into a dictionary.
 
-        headers = {}
-        for line in lines[1:]:
-            if ":" in line:
-                key, value = line.split(":", 1)
-                headers[key.strip()] = value.strip()
+        Args:
+            raw_headers: Header block bytes, lines separated by CRLF
 
-        return cls(status_code, status_message, headers, body)
+        Returns:
+            Dictionary mapping header names to stripped values
+        """
+        # Walk the header lines with a cursor instead of splitting into a list
+        header_section = raw_headers.decode("utf-8", errors="ignore")
+        headers = {}
+        pos = 0
+        section_end = len(header_section)
+        while pos < section_end:
+            line_end = header_section.find("\r\n", pos)
+            if line_end == -1:
+                line_end = section_end
+            colon = header_section.find(":", pos, line_end)
+            if colon != -1:
+                key = header_section[pos:colon].strip()
+                headers[key] = header_section[colon + 1 : line_end].strip()
+            pos = line_end + 2
+        return headers
 
     def __repr__(self):
         return f"IcapResponse(status={self.status_code}, message='{self.status_message}')"
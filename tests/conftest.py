@@ -2,13 +2,16 @@
 
 from __future__ import annotations
 
+import os
 import shutil
+import socket
 import ssl
 import subprocess
 import time
 from pathlib import Path
 
 import pytest
+from filelock import FileLock
 from testcontainers.compose import DockerCompose
 
 
@@ -48,37 +51,62 @@ def pytest_collection_modifyitems(items: list[pytest.Item]) -> None:
             item.add_marker(pytest.mark.timeout(300))
 
 
+def check_icap_service(host: str, port: int, service: str) -> None:
+    """
+    Check once that the ICAP service is accepting requests.
+
+    A plain TCP connect is tried first, which is cheap and fails fast while the
+    container is still starting, then the ICAP layer is confirmed with OPTIONS.
+
+    Args:
+        host: ICAP server host
+        port: ICAP server port
+        service: ICAP service name
+
+    Raises:
+        Exception: If the service is unreachable or OPTIONS does not succeed
+    """
+    from icap import IcapClient
+
+    socket.create_connection((host, port), timeout=1).close()
+    with IcapClient(host, port, timeout=5) as client:
+        response = client.options(service)
+    if not response.is_success:
+        raise RuntimeError(f"OPTIONS returned {response.status_code} {response.status_message}")
+
+
 def wait_for_icap_service(
-    host: str, port: int, service: str, timeout: int = 60, interval: float = 2.0
+    host: str, port: int, service: str, timeout: int = 60, max_interval: float = 2.0
 ) -> None:
     """
-    Wait for ICAP service to be ready by polling with OPTIONS requests.
+    Wait for ICAP service to be ready by polling check_icap_service().
+
+    Retries back off exponentially from 0.1s up to max_interval, so a service
+    that is already up is detected almost immediately.
 
     Args:
         host: ICAP server host
         port: ICAP server port
         service: ICAP service name
         timeout: Maximum time to wait in seconds
-        interval: Time between retries in seconds
+        max_interval: Upper bound on the delay between retries in seconds
 
     Raises:
         TimeoutError: If service doesn't become ready within timeout
     """
-    from icap import IcapClient
-
-    start_time = time.time()
+    deadline = time.monotonic() + timeout
+    interval = 0.1
     last_error = None
 
-    while time.time() - start_time < timeout:
+    while time.monotonic() < deadline:
         try:
-            with IcapClient(host, port, timeout=5) as client:
-                response = client.options(service)
-                if response.is_success:
-                    return  # Service is ready
+            check_icap_service(host, port, service)
+            return  # Service is ready
         except Exception as e:
             last_error = e
 
         time.sleep(interval)
+        interval = min(interval * 2, max_interval)
 
     raise TimeoutError(
         f"ICAP service at {host}:{port}/{service} not ready after {timeout}s. "
@@ -87,8 +115,19 @@ def wait_for_icap_service(
 
 
 @pytest.fixture(scope="session")
-def icap_service():
-    """Start ICAP service using docker-compose."""
+def icap_service(tmp_path_factory):
+    """
+    Start ICAP service using docker-compose.
+
+    Under pytest-xdist each worker process sets up its own session fixtures, so
+    workers share a single compose stack: the first worker to arrive starts it
+    and the last to finish stops it. A user count guarded by a lock file in the
+    run's shared temp directory coordinates them.
+
+    Set ICAP_REUSE_CONTAINERS=1 to keep the stack between runs: a stack that is
+    already serving (from an earlier run or ``just docker-up``) is used as is,
+    one is started only if needed, and it is never stopped by the tests.
+    """
     # Check if Docker is available before attempting to start containers
     docker_available, message = is_docker_available()
     if not docker_available:
@@ -96,11 +135,58 @@ def icap_service():
 
     docker_path = Path(__file__).parent.parent / "docker"
     config = {"host": "localhost", "port": 1344, "service": "avscan"}
+    compose = DockerCompose(str(docker_path), compose_file_name="docker-compose.yml")
+    shared_dir = tmp_path_factory.getbasetemp().parent
+    lock = FileLock(str(shared_dir / "icap_service.lock"))
+
+    if os.environ.get("ICAP_REUSE_CONTAINERS") == "1":
+        with lock:
+            try:
+                check_icap_service(config["host"], config["port"], config["service"])
+            except Exception:
+                compose.start()
+        wait_for_icap_service(config["host"], config["port"], config["service"])
+        yield config
+        return
+
+    if os.environ.get("PYTEST_XDIST_WORKER") is None:
+        with compose:
+            # Wait for ICAP service to be ready (polls until OPTIONS succeeds)
+            wait_for_icap_service(config["host"], config["port"], config["service"])
+            yield config
+        return
+
+    users_file = shared_dir / "icap_service.users"
 
-    with DockerCompose(str(docker_path), compose_file_name="docker-compose.yml"):
-        # Wait for ICAP service to be ready (polls until OPTIONS succeeds)
+    with lock:
+        users = int(users_file.read_text()) if users_file.exists() else 0
+        if users == 0:
+            compose.start()
+        users_file.write_text(str(users + 1))
+    try:
         wait_for_icap_service(config["host"], config["port"], config["service"])
         yield config
+    finally:
+        with lock:
+            users = int(users_file.read_text()) - 1
+            users_file.write_text(str(users))
+            if users == 0:
+                compose.stop()
+
+
+@pytest.fixture(scope="session")
+def icap_pool(icap_service):
+    """
+    Provide a connection pool shared by integration tests for the whole session.
+
+    Tests borrow a client with ``icap_pool.client()`` instead of opening their
+    own connection, so the TCP handshake is paid once rather than per test. A
+    connection the server has closed is replaced transparently by the pool.
+    """
+    from icap import IcapClientPool
+
+    with IcapClientPool(icap_service["host"], icap_service["port"]) as pool:
+        yield pool
 
 
 @pytest.fixture(scope="session")
@@ -130,3 +216,49 @@ def icap_service_ssl(icap_service):
         "ssl_context": ssl_context,
         "ca_cert": str(ca_cert_path),
     }
+
+
+class RecordingSocket:
+    """Socket stand-in that replays queued responses and records sent data.
+
+    Each queued response is returned by recv_into() in pieces no larger than
+    the requested size. Once the queue is empty (or an empty response is
+    reached) recv_into() returns 0, like a socket at EOF.
+    """
+
+    def __init__(self):
+        self.responses = []
+        self.sent = []
+
+    def queue(self, *responses):
+        self.responses.extend(responses)
+
+    def sendall(self, data):
+        # Copy, since streamed chunks are views over a reused buffer
+        self.sent.append(bytes(data))
+
+    def sendfile(self, file, offset=0, count=None):
+        file.seek(offset)
+        data = file.read(count)
+        self.sent.append(data)
+        return len(data)
+
+    def recv_into(self, buffer, nbytes=0, flags=0):
+        if not self.responses:
+            return 0
+        nbytes = nbytes or len(buffer)
+        data = self.responses.pop(0)
+        if len(data) > nbytes:
+            self.responses.insert(0, data[nbytes:])
+            data = data[:nbytes]
+        buffer[: len(data)] = data
+        return len(data)
+
+    def close(self):
+        pass
+
+
+@pytest.fixture
+def recording_socket() -> RecordingSocket:
+    """Provide a fresh RecordingSocket for wiring into a sync client."""
+    return RecordingSocket()
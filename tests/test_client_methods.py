@@ -5,24 +5,51 @@
 sync and async ICAP clients.
 """
 
-from unittest.mock import AsyncMock, MagicMock
+import asyncio
+import socket
+from unittest.mock import Mock
 
 import pytest
 
 from icap import AsyncIcapClient, IcapClient
 from icap.exception import IcapConnectionError, IcapProtocolError, IcapTimeoutError
 
+RESP_204 = b"ICAP/1.0 204 No Content\r\n\r\n"
+RESP_200 = b"ICAP/1.0 200 OK\r\n\r\n"
 
-def test_send_with_preview_complete_in_preview():
-    """Test preview mode when entire body fits in preview size."""
+
+@pytest.fixture
+def connected_sync_client(recording_socket):
+    """Provide a sync client wired to a recording socket as ``(client, sock)``."""
     client = IcapClient("localhost", 1344)
+    sock = recording_socket
+    client._socket = sock
+    client._connected = True
+    yield client, sock
 
-    mock_socket = MagicMock()
-    # Return 204 No Modification
-    mock_socket.recv.return_value = b"ICAP/1.0 204 No Content\r\n\r\n"
 
-    client._socket = mock_socket
-    client._connected = True
+@pytest.fixture
+async def connected_async_client():
+    """Provide an async client wired to a real reader and a mock writer.
+
+    Yields ``(client, reader, mock_writer)``; tests feed the response into the
+    ``asyncio.StreamReader`` with ``feed_data()``/``feed_eof()``.
+    """
+    client = AsyncIcapClient("localhost", 1344)
+    reader = asyncio.StreamReader()
+    # A spec on the writer class makes drain()/wait_closed() AsyncMocks
+    mock_writer = Mock(spec_set=asyncio.StreamWriter)
+    client._reader = reader
+    client._writer = mock_writer
+    yield client, reader, mock_writer
+
+
+def test_send_with_preview_complete_in_preview(connected_sync_client):
+    """Test preview mode when entire body fits in preview size."""
+    client, sock = connected_sync_client
+
+    # Return 204 No Modification
+    sock.queue(RESP_204)
 
     request = b"RESPMOD icap://localhost:1344/avscan ICAP/1.0\r\n\r\n"
     body = b"small"  # 5 bytes, fits in preview of 10
@@ -31,23 +58,19 @@ def test_send_with_preview_complete_in_preview():
 
     assert response.status_code == 204
     # Verify ieof was sent (entire body fit in preview)
-    sent_data = mock_socket.sendall.call_args[0][0]
+    sent_data = sock.sent[-1]
     assert b"ieof" in sent_data
 
 
-def test_send_with_preview_requires_continue():
+def test_send_with_preview_requires_continue(connected_sync_client):
     """Test preview mode when server requests remainder with 100 Continue."""
-    client = IcapClient("localhost", 1344)
+    client, sock = connected_sync_client
 
-    mock_socket = MagicMock()
     # First call returns 100 Continue, second returns 204
-    mock_socket.recv.side_effect = [
+    sock.queue(
         b"ICAP/1.0 100 Continue\r\n\r\n",
-        b"ICAP/1.0 204 No Content\r\n\r\n",
-    ]
-
-    client._socket = mock_socket
-    client._connected = True
+        RESP_204,
+    )
 
     request = b"RESPMOD icap://localhost:1344/avscan ICAP/1.0\r\n\r\n"
     body = b"a" * 100  # 100 bytes, more than preview of 10
@@ -56,7 +79,7 @@ def test_send_with_preview_requires_continue():
 
     assert response.status_code == 204
     # Should have called sendall multiple times (preview, then remainder)
-    assert mock_socket.sendall.call_count >= 2
+    assert len(sock.sent) >= 2
 
 
 def test_send_with_preview_not_connected():
@@ -70,47 +93,32 @@ def test_send_with_preview_not_connected():
     assert "Not connected" in str(exc_info.value)
 
 
-def test_send_with_preview_timeout():
+def test_send_with_preview_timeout(connected_sync_client):
     """Test that _send_with_preview handles socket timeout."""
-    import socket
-
-    client = IcapClient("localhost", 1344)
-
-    mock_socket = MagicMock()
+    client, _ = connected_sync_client
+    client._socket = mock_socket = Mock(spec_set=socket.socket)
     mock_socket.sendall.side_effect = socket.timeout("timed out")
 
-    client._socket = mock_socket
-    client._connected = True
-
     with pytest.raises(IcapTimeoutError):
         client._send_with_preview(b"request", b"body", preview_size=10)
 
 
-def test_send_with_preview_connection_error():
+def test_send_with_preview_connection_error(connected_sync_client):
     """Test that _send_with_preview handles connection errors."""
-    client = IcapClient("localhost", 1344)
-
-    mock_socket = MagicMock()
+    client, _ = connected_sync_client
+    client._socket = mock_socket = Mock(spec_set=socket.socket)
     mock_socket.sendall.side_effect = OSError("Connection reset")
 
-    client._socket = mock_socket
-    client._connected = True
-
     with pytest.raises(IcapConnectionError):
         client._send_with_preview(b"request", b"body", preview_size=10)
 
     assert not client._connected
 
 
-def test_receive_response_simple():
+def test_receive_response_simple(connected_sync_client):
     """Test receiving a simple ICAP response."""
-    client = IcapClient("localhost", 1344)
-
-    mock_socket = MagicMock()
-    mock_socket.recv.return_value = b"ICAP/1.0 200 OK\r\nServer: Test\r\n\r\n"
-
-    client._socket = mock_socket
-    client._connected = True
+    client, sock = connected_sync_client
+    sock.queue(b"ICAP/1.0 200 OK\r\nServer: Test\r\n\r\n")
 
     response = client._receive_response()
 
@@ -118,20 +126,93 @@ def test_receive_response_simple():
     assert response.status_message == "OK"
 
 
-def test_receive_response_with_body():
+def test_receive_response_with_body(connected_sync_client):
     """Test receiving response with Content-Length body."""
-    client = IcapClient("localhost", 1344)
+    client, sock = connected_sync_client
+    sock.queue(b"ICAP/1.0 200 OK\r\nContent-Length: 5\r\n\r\nhello")
 
-    mock_socket = MagicMock()
-    mock_socket.recv.return_value = b"ICAP/1.0 200 OK\r\nContent-Length: 5\r\n\r\nhello"
+    response = client._receive_response()
+
+    assert response.status_code == 200
+    assert b"hello" in response.body or response.body == b"hello"
 
-    client._socket = mock_socket
-    client._connected = True
+
+def test_receive_response_with_chunked_body(connected_sync_client):
+    """Test receiving a chunked response whose header terminator straddles reads."""
+    client, sock = connected_sync_client
+    sock.queue(
+        b"ICAP/1.0 200 OK\r\nTransfer-Encoding: chunked\r\n\r",
+        b"\n5\r\nhello\r\n0\r\n\r\n",
+    )
 
     response = client._receive_response()
 
     assert response.status_code == 200
-    assert b"hello" in response.body or response.body == b"hello"
+    assert response.body == b"hello"
+
+
+def test_receive_response_reuses_recv_buffer(connected_sync_client):
+    """Test every recv_into call receives into the client's single buffer."""
+    client, sock = connected_sync_client
+    sock.queue(RESP_204, RESP_200)
+    buffers = []
+    recv_into = sock.recv_into
+
+    def recording_recv_into(buffer, nbytes=0):
+        buffers.append(buffer)
+        return recv_into(buffer, nbytes)
+
+    sock.recv_into = recording_recv_into
+
+    assert client._receive_response().status_code == 204
+    assert client._receive_response().status_code == 200
+    assert len(buffers) == 2
+    assert all(buffer is client._recv_buffer for buffer in buffers)
+
+
+def test_receive_response_reads_body_in_bounded_steps(connected_sync_client):
+    """Test the Content-Length body is received in reads no larger than the buffer."""
+    client, sock = connected_sync_client
+    body = b"x" * (client.BUFFER_SIZE * 2 + 10)
+    header = b"ICAP/1.0 200 OK\r\nContent-Length: %d\r\n\r\n" % len(body)
+    sock.queue(header, body)
+    sizes = []
+    recv_into = sock.recv_into
+
+    def recording_recv_into(buffer, nbytes=0, flags=0):
+        sizes.append(nbytes or len(buffer))
+        return recv_into(buffer, nbytes, flags)
+
+    sock.recv_into = recording_recv_into
+
+    response = client._receive_response()
+
+    assert response.body == body
+    assert max(sizes) <= client.BUFFER_SIZE
+    assert sizes[-1] == 10
+
+
+def test_receive_response_huge_content_length_fails_cleanly(connected_sync_client):
+    """Test an oversized Content-Length is not preallocated before the body arrives."""
+    client, sock = connected_sync_client
+    sock.queue(b"ICAP/1.0 200 OK\r\nContent-Length: 99999999999999999999\r\n\r\nabc")
+
+    with pytest.raises(IcapProtocolError) as exc_info:
+        client._receive_response()
+
+    assert "Incomplete response" in str(exc_info.value)
+    assert "got 3" in str(exc_info.value)
+
+
+def test_receive_response_204_does_not_read_a_body(connected_sync_client):
+    """Test a 204 returns after its headers even if it advertises a body."""
+    client, sock = connected_sync_client
+    sock.queue(b"ICAP/1.0 204 No Content\r\nContent-Length: 1000\r\n\r\n")
+
+    response = client._receive_response()
+
+    assert response.is_no_modification
+    assert response.body == b""
 
 
 def test_receive_response_not_connected():
@@ -145,17 +226,12 @@ def test_receive_response_not_connected():
     assert "Not connected" in str(exc_info.value)
 
 
-def test_scan_stream_chunked_sends_chunks():
+def test_scan_stream_chunked_sends_chunks(connected_sync_client):
     """Test that _scan_stream_chunked properly chunks data."""
     from io import BytesIO
 
-    client = IcapClient("localhost", 1344)
-
-    mock_socket = MagicMock()
-    mock_socket.recv.return_value = b"ICAP/1.0 204 No Content\r\n\r\n"
-
-    client._socket = mock_socket
-    client._connected = True
+    client, sock = connected_sync_client
+    sock.queue(RESP_204)
 
     stream = BytesIO(b"a" * 100)
 
@@ -163,22 +239,24 @@ def test_scan_stream_chunked_sends_chunks():
 
     assert response.status_code == 204
     # Should have sent multiple chunks
-    assert mock_socket.sendall.call_count >= 3  # headers + chunks + terminator
+    assert len(sock.sent) >= 3  # headers + chunks + terminator
+    # Each chunk goes out as a single framed send
+    assert sock.sent[1] == b"1E\r\n" + b"a" * 30 + b"\r\n"
+    assert sock.sent[-2:] == [b"A\r\n" + b"a" * 10 + b"\r\n", b"0\r\n\r\n"]
 
 
-def test_scan_stream_chunked_not_connected(mocker):
+def test_scan_stream_chunked_not_connected(recording_socket, mocker):
     """Test _scan_stream_chunked auto-connects if needed."""
     from io import BytesIO
 
     client = IcapClient("localhost", 1344)
     client._connected = False
 
-    mock_socket = mocker.MagicMock()
-    mock_socket.recv.return_value = b"ICAP/1.0 204 No Content\r\n\r\n"
-    mock_socket.sendall = mocker.MagicMock()
+    sock = recording_socket
+    sock.queue(RESP_204)
 
     def set_connected():
-        client._socket = mock_socket
+        client._socket = sock
         client._connected = True
 
     mocker.patch.object(client, "connect", side_effect=set_connected)
@@ -223,30 +301,83 @@ def test_iter_chunks_empty_stream():
     assert chunks == []
 
 
-def test_reqmod_basic():
-    """Test basic REQMOD request."""
+def test_iter_chunk_frames_encodes_chunks():
+    """Test frames carry the size line, data and CRLF, including a short last chunk."""
+    from io import BytesIO
+
     client = IcapClient("localhost", 1344)
 
-    mock_socket = MagicMock()
-    mock_socket.recv.return_value = b"ICAP/1.0 204 No Content\r\n\r\n"
+    stream = BytesIO(b"a" * 20)
+    frames = [(bytes(frame), n) for frame, n in client._iter_chunk_frames(stream, chunk_size=16)]
 
-    client._socket = mock_socket
-    client._connected = True
+    assert frames == [(b"10\r\n" + b"a" * 16 + b"\r\n", 16), (b"4\r\naaaa\r\n", 4)]
 
-    response = client.reqmod("avscan", b"GET / HTTP/1.1\r\nHost: test\r\n\r\n")
 
-    assert response.status_code == 204
+def test_iter_chunk_frames_reuses_buffer_for_readinto_streams():
+    """Test readinto-capable streams are framed in place in one buffer."""
+    from io import BytesIO
 
+    client = IcapClient("localhost", 1344)
+
+    frames = client._iter_chunk_frames(BytesIO(b"abcdef"), chunk_size=3)
+    first, _ = next(frames)
+    second, _ = next(frames)
+
+    assert isinstance(first, memoryview)
+    assert first.obj is second.obj
+    assert bytes(second) == b"3\r\ndef\r\n"
+
+
+def test_iter_chunk_frames_read_only_stream():
+    """Test streams without readinto() are read and encoded per chunk."""
+
+    class ReadOnlyStream:
+        def __init__(self, data):
+            self._data = data
+
+        def read(self, size):
+            chunk, self._data = self._data[:size], self._data[size:]
+            return chunk
 
-def test_reqmod_with_body():
-    """Test REQMOD with HTTP request body."""
     client = IcapClient("localhost", 1344)
 
-    mock_socket = MagicMock()
-    mock_socket.recv.return_value = b"ICAP/1.0 204 No Content\r\n\r\n"
+    frames = list(client._iter_chunk_frames(ReadOnlyStream(b"hello!"), chunk_size=5))
 
-    client._socket = mock_socket
-    client._connected = True
+    assert frames == [(b"5\r\nhello\r\n", 5), (b"1\r\n!\r\n", 1)]
+
+
+def test_iter_chunks_read_only_stream():
+    """Test chunk iteration only needs a read() method."""
+
+    class ReadOnlyStream:
+        def __init__(self, data):
+            self._data = data
+
+        def read(self, size):
+            chunk, self._data = self._data[:size], self._data[size:]
+            return chunk
+
+    client = IcapClient("localhost", 1344)
+
+    chunks = list(client._iter_chunks(ReadOnlyStream(b"hello world"), chunk_size=5))
+
+    assert chunks == [b"hello", b" worl", b"d"]
+
+
+def test_reqmod_basic(connected_sync_client):
+    """Test basic REQMOD request."""
+    client, sock = connected_sync_client
+    sock.queue(RESP_204)
+
+    response = client.reqmod("avscan", b"GET / HTTP/1.1\r\nHost: test\r\n\r\n")
+
+    assert response.status_code == 204
+
+
+def test_reqmod_with_body(connected_sync_client):
+    """Test REQMOD with HTTP request body."""
+    client, sock = connected_sync_client
+    sock.queue(RESP_204)
 
     response = client.reqmod(
         "avscan",
@@ -256,19 +387,14 @@ def test_reqmod_with_body():
 
     assert response.status_code == 204
     # Verify chunked encoding was used for body
-    sent_data = mock_socket.sendall.call_args[0][0]
+    sent_data = sock.sent[-1]
     assert b"req-body=" in sent_data
 
 
-def test_reqmod_with_custom_headers():
+def test_reqmod_with_custom_headers(connected_sync_client):
     """Test REQMOD with custom ICAP headers."""
-    client = IcapClient("localhost", 1344)
-
-    mock_socket = MagicMock()
-    mock_socket.recv.return_value = b"ICAP/1.0 204 No Content\r\n\r\n"
-
-    client._socket = mock_socket
-    client._connected = True
+    client, sock = connected_sync_client
+    sock.queue(RESP_204)
 
     response = client.reqmod(
         "avscan",
@@ -277,20 +403,20 @@ def test_reqmod_with_custom_headers():
     )
 
     assert response.status_code == 204
-    sent_data = mock_socket.sendall.call_args[0][0]
+    sent_data = sock.sent[-1]
     assert b"X-Custom: value" in sent_data
 
 
-def test_reqmod_auto_connects(mocker):
+def test_reqmod_auto_connects(recording_socket, mocker):
     """Test that reqmod auto-connects if not connected."""
     client = IcapClient("localhost", 1344)
     client._connected = False
 
-    mock_socket = mocker.MagicMock()
-    mock_socket.recv.return_value = b"ICAP/1.0 204 No Content\r\n\r\n"
+    sock = recording_socket
+    sock.queue(RESP_204)
 
     def set_connected():
-        client._socket = mock_socket
+        client._socket = sock
         client._connected = True
 
     mock_connect = mocker.patch.object(client, "connect", side_effect=set_connected)
@@ -301,36 +427,31 @@ def set_connected():
     assert response.status_code == 204
 
 
-def test_options_basic():
+def test_options_basic(connected_sync_client):
     """Test basic OPTIONS request."""
-    client = IcapClient("localhost", 1344)
-
-    mock_socket = MagicMock()
-    mock_socket.recv.return_value = (
+    client, sock = connected_sync_client
+    sock.queue(
         b"ICAP/1.0 200 OK\r\nMethods: RESPMOD, REQMOD\r\nAllow: 204\r\nPreview: 1024\r\n\r\n"
     )
 
-    client._socket = mock_socket
-    client._connected = True
-
     response = client.options("avscan")
 
     assert response.status_code == 200
-    sent_data = mock_socket.sendall.call_args[0][0]
+    sent_data = sock.sent[-1]
     assert b"OPTIONS" in sent_data
     assert b"null-body=0" in sent_data
 
 
-def test_options_auto_connects(mocker):
+def test_options_auto_connects(recording_socket, mocker):
     """Test that options auto-connects if not connected."""
     client = IcapClient("localhost", 1344)
     client._connected = False
 
-    mock_socket = mocker.MagicMock()
-    mock_socket.recv.return_value = b"ICAP/1.0 200 OK\r\n\r\n"
+    sock = recording_socket
+    sock.queue(RESP_200)
 
     def set_connected():
-        client._socket = mock_socket
+        client._socket = sock
         client._connected = True
 
     mock_connect = mocker.patch.object(client, "connect", side_effect=set_connected)
@@ -341,15 +462,9 @@ def set_connected():
     assert response.status_code == 200
 
 
-def test_read_chunked_body_large_chunks():
+def test_read_chunked_body_large_chunks(connected_sync_client):
     """Test reading chunked body with large chunk sizes."""
-    client = IcapClient("localhost", 1344)
-
-    mock_socket = MagicMock()
-    mock_socket.recv.return_value = b""
-
-    client._socket = mock_socket
-    client._connected = True
+    client, _ = connected_sync_client
 
     # Large chunk (1000 bytes in hex = 3E8)
     large_data = b"x" * 1000
@@ -359,15 +474,9 @@ def test_read_chunked_body_large_chunks():
     assert body == large_data
 
 
-def test_read_chunked_body_multiple_chunks():
+def test_read_chunked_body_multiple_chunks(connected_sync_client):
     """Test reading multiple chunks in sequence."""
-    client = IcapClient("localhost", 1344)
-
-    mock_socket = MagicMock()
-    mock_socket.recv.return_value = b""
-
-    client._socket = mock_socket
-    client._connected = True
+    client, _ = connected_sync_client
 
     # Three chunks: "aaa", "bbb", "ccc"
     initial = b"3\r\naaa\r\n3\r\nbbb\r\n3\r\nccc\r\n0\r\n\r\n"
@@ -376,18 +485,26 @@ def test_read_chunked_body_multiple_chunks():
     assert body == b"aaabbbccc"
 
 
-@pytest.mark.asyncio
-async def test_async_read_chunked_body_simple():
-    """Test async chunked body reading."""
-    client = AsyncIcapClient("localhost", 1344)
+def test_read_chunked_body_fragmented_reads(connected_sync_client):
+    """Test chunk boundaries that straddle many small reads."""
+    client, sock = connected_sync_client
 
-    mock_reader = AsyncMock()
-    mock_reader.read.return_value = b""
+    raw = b"3\r\naaa\r\n3\r\nbbb\r\n0\r\n\r\n"
+    sock.queue(*(raw[i : i + 2] for i in range(4, len(raw), 2)))
+
+    body = client._read_chunked_body(raw[:4])
+    assert body == b"aaabbb"
+    assert sock.responses == []
 
-    client._reader = mock_reader
-    client._connected = True
 
-    body = await client._read_chunked_body(b"5\r\nHello\r\n0\r\n\r\n")
+@pytest.mark.asyncio
+async def test_async_read_chunked_body_simple(connected_async_client):
+    """Test async chunked body reading."""
+    client, reader, _ = connected_async_client
+    reader.feed_data(b"5\r\nHello\r\n0\r\n\r\n")
+    reader.feed_eof()
+
+    body = await client._read_chunked_body()
     assert body == b"Hello"
 
 
@@ -395,19 +512,46 @@ async def test_async_read_chunked_body_simple():
 async def test_async_read_chunked_body_connection_close():
     """Test async chunked body raises on connection close."""
     client = AsyncIcapClient("localhost", 1344)
-
-    mock_reader = AsyncMock()
-    mock_reader.read.return_value = b""  # Connection closed
-
-    client._reader = mock_reader
-    client._connected = True
+    client._reader = asyncio.StreamReader()
+    client._reader.feed_data(b"A\r\n")  # Expecting 10 bytes
+    client._reader.feed_eof()  # Connection closed
 
     with pytest.raises(IcapProtocolError) as exc_info:
-        await client._read_chunked_body(b"A\r\n")  # Expecting 10 bytes
+        await client._read_chunked_body()
 
     assert "Connection closed" in str(exc_info.value)
 
 
+@pytest.mark.asyncio
+async def test_async_read_chunked_body_split_across_reads():
+    """Test async chunked body completes partial lines and chunks from the stream."""
+    client = AsyncIcapClient("localhost", 1344)
+    client._reader = asyncio.StreamReader()
+    client._reader.feed_data(b"5\r")
+    client._reader.feed_data(b"\nHel")
+    client._reader.feed_data(b"lo\r\n5\r\nWorld\r\n0\r\n\r\nICAP/1.0 204")
+
+    body = await client._read_chunked_body()
+
+    assert body == b"HelloWorld"
+    # The trailer is consumed but nothing past the body is read
+    assert await client._reader.read(100) == b"ICAP/1.0 204"
+
+
+@pytest.mark.asyncio
+async def test_async_read_chunked_body_buffered_chunks_and_trailer():
+    """Test async chunked body reads several chunks and a trailer split across reads."""
+    client = AsyncIcapClient("localhost", 1344)
+    client._reader = asyncio.StreamReader()
+    client._reader.feed_data(b"3\r\naaa\r\n3\r\nbbb\r\n0\r\nX-")
+    client._reader.feed_data(b"Trailer: 1\r\n\r\nICAP/1.0 204")
+
+    body = await client._read_chunked_body()
+
+    assert body == b"aaabbb"
+    assert await client._reader.read(100) == b"ICAP/1.0 204"
+
+
 @pytest.mark.asyncio
 async def test_async_receive_response_not_connected():
     """Test async _receive_response raises when not connected."""
@@ -421,18 +565,11 @@ async def test_async_receive_response_not_connected():
 
 
 @pytest.mark.asyncio
-async def test_async_receive_response_simple():
+async def test_async_receive_response_simple(connected_async_client):
     """Test receiving simple async response."""
-    client = AsyncIcapClient("localhost", 1344)
-
-    mock_reader = AsyncMock()
-    mock_reader.read.side_effect = [
-        b"ICAP/1.0 200 OK\r\n\r\n",
-        b"",
-    ]
-
-    client._reader = mock_reader
-    client._connected = True
+    client, reader, _ = connected_async_client
+    reader.feed_data(RESP_200)
+    reader.feed_eof()
 
     response_data = await client._receive_response()
     assert b"200 OK" in response_data
@@ -454,38 +591,28 @@ async def test_async_iter_chunks():
 
 
 @pytest.mark.asyncio
-async def test_async_scan_stream_chunked():
+async def test_async_scan_stream_chunked(connected_async_client):
     """Test async chunked stream scanning."""
     from io import BytesIO
 
-    client = AsyncIcapClient("localhost", 1344)
-
-    mock_writer = MagicMock()
-    mock_writer.write = MagicMock()
-    mock_writer.drain = AsyncMock()
-
-    mock_reader = AsyncMock()
-    mock_reader.read.side_effect = [
-        b"ICAP/1.0 204 No Content\r\n\r\n",
-        b"",
-    ]
-
-    client._writer = mock_writer
-    client._reader = mock_reader
-    client._connected = True
+    client, reader, mock_writer = connected_async_client
+    reader.feed_data(RESP_204)
+    reader.feed_eof()
 
     stream = BytesIO(b"test data for chunked scan")
 
     response = await client._scan_stream_chunked(stream, "avscan", "test.txt", 10)
 
     assert response.status_code == 204
+    # Each chunk is handed to the transport as one header/data/CRLF batch
+    sent_chunks = [b"".join(call.args[0]) for call in mock_writer.writelines.call_args_list]
+    assert sent_chunks == [b"A\r\ntest data \r\n", b"A\r\nfor chunke\r\n", b"6\r\nd scan\r\n"]
+    mock_writer.write.assert_called_with(b"0\r\n\r\n")
 
 
 def test_connect_to_invalid_host(mocker):
     """Test connection to invalid host raises IcapConnectionError."""
-    import socket
-
-    mock_socket_instance = MagicMock()
+    mock_socket_instance = Mock(spec_set=socket.socket)
     mock_socket_instance.connect.side_effect = socket.gaierror(
         socket.EAI_NONAME, "Name or service not known"
     )
@@ -502,7 +629,7 @@ def test_connect_to_invalid_host(mocker):
 
 def test_connect_to_refused_port(mocker):
     """Test connection to port with no listener raises IcapConnectionError."""
-    mock_socket_instance = MagicMock()
+    mock_socket_instance = Mock(spec_set=socket.socket)
     mock_socket_instance.connect.side_effect = ConnectionRefusedError("Connection refused")
     mocker.patch("socket.socket", return_value=mock_socket_instance)
 
@@ -517,8 +644,6 @@ def test_connect_to_refused_port(mocker):
 
 async def test_async_connect_to_invalid_host(mocker):
     """Test async connection to invalid host raises IcapConnectionError."""
-    import socket
-
     mocker.patch(
         "asyncio.open_connection",
         side_effect=socket.gaierror(socket.EAI_NONAME, "Name or service not known"),
@@ -547,17 +672,11 @@ async def test_async_connect_to_refused_port(mocker):
     assert "Failed to connect" in str(exc_info.value)
 
 
-def test_timeout_during_recv():
+def test_timeout_during_recv(connected_sync_client):
     """Test that socket timeout during recv is properly handled."""
-    import socket
-
-    client = IcapClient("localhost", 1344)
-
-    mock_socket = MagicMock()
-    mock_socket.recv.side_effect = socket.timeout("recv timed out")
-
-    client._socket = mock_socket
-    client._connected = True
+    client, _ = connected_sync_client
+    client._socket = mock_socket = Mock(spec_set=socket.socket)
+    mock_socket.recv_into.side_effect = socket.timeout("recv timed out")
 
     with pytest.raises(IcapTimeoutError):
         client._receive_response()
@@ -640,20 +759,13 @@ def test_is_connected_property_exists():
 
 
 @pytest.mark.asyncio
-async def test_async_options_basic():
+async def test_async_options_basic(connected_async_client):
     """Test basic async OPTIONS request."""
-    client = AsyncIcapClient("localhost", 1344)
-
-    mock_writer = AsyncMock()
-    mock_reader = AsyncMock()
-    mock_reader.read.side_effect = [
-        b"ICAP/1.0 200 OK\r\nMethods: RESPMOD, REQMOD\r\nAllow: 204\r\nPreview: 1024\r\n\r\n",
-        b"",
-    ]
-
-    client._writer = mock_writer
-    client._reader = mock_reader
-    client._connected = True
+    client, reader, mock_writer = connected_async_client
+    reader.feed_data(
+        b"ICAP/1.0 200 OK\r\nMethods: RESPMOD, REQMOD\r\nAllow: 204\r\nPreview: 1024\r\n\r\n"
+    )
+    reader.feed_eof()
 
     response = await client.options("avscan")
 
@@ -670,13 +782,14 @@ async def test_async_options_auto_connects(mocker):
     client = AsyncIcapClient("localhost", 1344)
     client._connected = False
 
-    mock_writer = AsyncMock()
-    mock_reader = AsyncMock()
-    mock_reader.read.side_effect = [b"ICAP/1.0 200 OK\r\n\r\n", b""]
+    mock_writer = Mock(spec_set=asyncio.StreamWriter)
+    reader = asyncio.StreamReader()
+    reader.feed_data(RESP_200)
+    reader.feed_eof()
 
     async def set_connected():
         client._writer = mock_writer
-        client._reader = mock_reader
+        client._reader = reader
         client._connected = True
 
     mock_connect = mocker.patch.object(client, "connect", side_effect=set_connected)
@@ -688,20 +801,11 @@ async def set_connected():
 
 
 @pytest.mark.asyncio
-async def test_async_respmod_basic():
+async def test_async_respmod_basic(connected_async_client):
     """Test basic async RESPMOD request."""
-    client = AsyncIcapClient("localhost", 1344)
-
-    mock_writer = AsyncMock()
-    mock_reader = AsyncMock()
-    mock_reader.read.side_effect = [
-        b"ICAP/1.0 200 OK\r\nEncapsulated: res-hdr=0\r\n\r\n",
-        b"",
-    ]
-
-    client._writer = mock_writer
-    client._reader = mock_reader
-    client._connected = True
+    client, reader, mock_writer = connected_async_client
+    reader.feed_data(b"ICAP/1.0 200 OK\r\nEncapsulated: res-hdr=0\r\n\r\n")
+    reader.feed_eof()
 
     http_request = b"GET / HTTP/1.1\r\nHost: example.com\r\n\r\n"
     http_response = b"HTTP/1.1 200 OK\r\nContent-Type: text/html\r\n\r\n<html>body</html>"
@@ -714,20 +818,11 @@ async def test_async_respmod_basic():
 
 
 @pytest.mark.asyncio
-async def test_async_reqmod_basic():
+async def test_async_reqmod_basic(connected_async_client):
     """Test basic async REQMOD request."""
-    client = AsyncIcapClient("localhost", 1344)
-
-    mock_writer = AsyncMock()
-    mock_reader = AsyncMock()
-    mock_reader.read.side_effect = [
-        b"ICAP/1.0 200 OK\r\n\r\n",
-        b"",
-    ]
-
-    client._writer = mock_writer
-    client._reader = mock_reader
-    client._connected = True
+    client, reader, mock_writer = connected_async_client
+    reader.feed_data(RESP_200)
+    reader.feed_eof()
 
     http_request = b"GET / HTTP/1.1\r\nHost: example.com\r\n\r\n"
 
@@ -739,20 +834,11 @@ async def test_async_reqmod_basic():
 
 
 @pytest.mark.asyncio
-async def test_async_scan_bytes_basic():
+async def test_async_scan_bytes_basic(connected_async_client):
     """Test async scan_bytes method."""
-    client = AsyncIcapClient("localhost", 1344)
-
-    mock_writer = AsyncMock()
-    mock_reader = AsyncMock()
-    mock_reader.read.side_effect = [
-        b"ICAP/1.0 204 No Content\r\n\r\n",
-        b"",
-    ]
-
-    client._writer = mock_writer
-    client._reader = mock_reader
-    client._connected = True
+    client, reader, _ = connected_async_client
+    reader.feed_data(RESP_204)
+    reader.feed_eof()
 
     response = await client.scan_bytes(b"clean file content", service="avscan")
 
@@ -761,20 +847,11 @@ async def test_async_scan_bytes_basic():
 
 
 @pytest.mark.asyncio
-async def test_async_scan_bytes_with_filename():
+async def test_async_scan_bytes_with_filename(connected_async_client):
     """Test async scan_bytes with custom filename."""
-    client = AsyncIcapClient("localhost", 1344)
-
-    mock_writer = AsyncMock()
-    mock_reader = AsyncMock()
-    mock_reader.read.side_effect = [
-        b"ICAP/1.0 204 No Content\r\n\r\n",
-        b"",
-    ]
-
-    client._writer = mock_writer
-    client._reader = mock_reader
-    client._connected = True
+    client, reader, mock_writer = connected_async_client
+    reader.feed_data(RESP_204)
+    reader.feed_eof()
 
     response = await client.scan_bytes(b"clean file content", service="avscan", filename="test.pdf")
 
@@ -784,24 +861,15 @@ async def test_async_scan_bytes_with_filename():
 
 
 @pytest.mark.asyncio
-async def test_async_scan_file_basic(mocker, tmp_path):
+async def test_async_scan_file_basic(connected_async_client, mocker, tmp_path):
     """Test async scan_file method."""
     # Create a temporary test file
     test_file = tmp_path / "test.txt"
     test_file.write_bytes(b"test file content")
 
-    client = AsyncIcapClient("localhost", 1344)
-
-    mock_writer = AsyncMock()
-    mock_reader = AsyncMock()
-    mock_reader.read.side_effect = [
-        b"ICAP/1.0 204 No Content\r\n\r\n",
-        b"",
-    ]
-
-    client._writer = mock_writer
-    client._reader = mock_reader
-    client._connected = True
+    client, reader, _ = connected_async_client
+    reader.feed_data(RESP_204)
+    reader.feed_eof()
 
     response = await client.scan_file(str(test_file), service="avscan")
 
@@ -820,20 +888,13 @@ async def test_async_scan_file_not_found():
 
 
 @pytest.mark.asyncio
-async def test_async_send_with_preview_complete_in_preview():
+async def test_async_send_with_preview_complete_in_preview(connected_async_client):
     """Test async preview mode when entire body fits in preview size."""
-    client = AsyncIcapClient("localhost", 1344)
+    client, reader, _ = connected_async_client
 
-    mock_writer = AsyncMock()
-    mock_reader = AsyncMock()
     # Server responds with 204 (no modification needed)
-    mock_reader.read.side_effect = [
-        b"ICAP/1.0 204 No Content\r\n\r\n",
-        b"",
-    ]
-
-    client._writer = mock_writer
-    client._reader = mock_reader
+    reader.feed_data(RESP_204)
+    reader.feed_eof()
 
     # Build a proper ICAP request with headers
     request = (
@@ -850,21 +911,14 @@ async def test_async_send_with_preview_complete_in_preview():
 
 
 @pytest.mark.asyncio
-async def test_async_send_with_preview_requires_continue():
+async def test_async_send_with_preview_requires_continue(connected_async_client):
     """Test async preview mode when server requests remaining body."""
-    client = AsyncIcapClient("localhost", 1344)
+    client, reader, mock_writer = connected_async_client
 
-    mock_writer = AsyncMock()
-    mock_reader = AsyncMock()
     # First response: 100 Continue, then 204 No Content
-    mock_reader.read.side_effect = [
-        b"ICAP/1.0 100 Continue\r\n\r\n",
-        b"ICAP/1.0 204 No Content\r\n\r\n",
-        b"",
-    ]
-
-    client._writer = mock_writer
-    client._reader = mock_reader
+    reader.feed_data(b"ICAP/1.0 100 Continue\r\n\r\n")
+    reader.feed_data(RESP_204)
+    reader.feed_eof()
 
     # Build request and large body
     request = (
@@ -883,17 +937,9 @@ async def test_async_send_with_preview_requires_continue():
 
 
 @pytest.mark.asyncio
-async def test_async_disconnect():
+async def test_async_disconnect(connected_async_client):
     """Test async disconnect method."""
-    client = AsyncIcapClient("localhost", 1344)
-
-    mock_writer = MagicMock()
-    mock_writer.close = MagicMock()
-    mock_writer.wait_closed = AsyncMock()
-    mock_reader = AsyncMock()
-
-    client._writer = mock_writer
-    client._reader = mock_reader
+    client, _, mock_writer = connected_async_client
 
     await client.disconnect()
 
@@ -908,10 +954,8 @@ async def test_async_context_manager():
     """Test async context manager protocol."""
     client = AsyncIcapClient("localhost", 1344)
 
-    mock_writer = MagicMock()
-    mock_writer.close = MagicMock()
-    mock_writer.wait_closed = AsyncMock()
-    mock_reader = AsyncMock()
+    mock_writer = Mock(spec_set=asyncio.StreamWriter)
+    mock_reader = Mock(spec_set=asyncio.StreamReader)
 
     async def mock_connect():
         client._writer = mock_writer
@@ -927,20 +971,16 @@ async def mock_connect():
     assert client.is_connected is False
 
 
-def test_receive_response_with_large_body_multiple_recvs():
+def test_receive_response_with_large_body_multiple_recvs(connected_sync_client):
     """Test receiving response with body split across multiple recv calls."""
-    client = IcapClient("localhost", 1344)
+    client, sock = connected_sync_client
 
-    mock_socket = MagicMock()
     # Body is 20 bytes but comes in chunks
-    mock_socket.recv.side_effect = [
+    sock.queue(
         b"ICAP/1.0 200 OK\r\nContent-Length: 20\r\n\r\nHello",  # 5 bytes of body
         b" World",  # 6 bytes
         b" Test!!!!",  # 9 bytes, total = 20
-    ]
-
-    client._socket = mock_socket
-    client._connected = True
+    )
 
     response = client._receive_response()
 
@@ -948,22 +988,17 @@ def test_receive_response_with_large_body_multiple_recvs():
     assert response.body == b"Hello World Test!!!!"
 
 
-def test_send_and_receive_with_content_length_body():
+def test_send_and_receive_with_content_length_body(connected_sync_client):
     """Test _send_and_receive handles Content-Length response bodies."""
-    client = IcapClient("localhost", 1344)
+    client, sock = connected_sync_client
 
-    mock_socket = MagicMock()
     # Response with body
     body_content = b"This is a response body with content"
     response_data = (
         f"ICAP/1.0 200 OK\r\nContent-Length: {len(body_content)}\r\n\r\n"
     ).encode() + body_content
 
-    mock_socket.recv.return_value = response_data
-    mock_socket.sendall = MagicMock()
-
-    client._socket = mock_socket
-    client._connected = True
+    sock.queue(response_data)
 
     response = client._send_and_receive(b"OPTIONS icap://test ICAP/1.0\r\n\r\n")
 
@@ -971,11 +1006,10 @@ def test_send_and_receive_with_content_length_body():
     assert body_content in response.body
 
 
-def test_send_and_receive_with_chunked_body():
+def test_send_and_receive_with_chunked_body(connected_sync_client):
     """Test _send_and_receive handles chunked transfer encoding."""
-    client = IcapClient("localhost", 1344)
+    client, sock = connected_sync_client
 
-    mock_socket = MagicMock()
     # Chunked response: "Hello" (5 bytes) + "World" (5 bytes)
     response_data = (
         b"ICAP/1.0 200 OK\r\n"
@@ -985,29 +1019,20 @@ def test_send_and_receive_with_chunked_body():
         b"5\r\nWorld\r\n"
         b"0\r\n\r\n"
     )
-    mock_socket.recv.return_value = response_data
-    mock_socket.sendall = MagicMock()
-
-    client._socket = mock_socket
-    client._connected = True
+    sock.queue(response_data)
 
     response = client._send_and_receive(b"OPTIONS icap://test ICAP/1.0\r\n\r\n")
 
     assert response.status_code == 200
 
 
-def test_receive_response_body_split_at_header_boundary():
+def test_receive_response_body_split_at_header_boundary(connected_sync_client):
     """Test response where body arrives in separate recv from headers."""
-    client = IcapClient("localhost", 1344)
-
-    mock_socket = MagicMock()
-    mock_socket.recv.side_effect = [
+    client, sock = connected_sync_client
+    sock.queue(
         b"ICAP/1.0 200 OK\r\nContent-Length: 10\r\n\r\n",  # Headers only, no body yet
         b"0123456789",  # Body comes separately
-    ]
-
-    client._socket = mock_socket
-    client._connected = True
+    )
 
     response = client._receive_response()
 
@@ -1016,21 +1041,14 @@ def test_receive_response_body_split_at_header_boundary():
 
 
 @pytest.mark.asyncio
-async def test_async_receive_response_with_content_length():
+async def test_async_receive_response_with_content_length(connected_async_client):
     """Test async response handling with Content-Length body."""
-    client = AsyncIcapClient("localhost", 1344)
+    client, reader, _ = connected_async_client
 
-    mock_reader = AsyncMock()
     body = b"Async response body content"
     response = f"ICAP/1.0 200 OK\r\nContent-Length: {len(body)}\r\n\r\n".encode() + body
-    mock_reader.read.return_value = response
-
-    mock_writer = MagicMock()
-    mock_writer.write = MagicMock()
-    mock_writer.drain = AsyncMock()
-
-    client._reader = mock_reader
-    client._writer = mock_writer
+    reader.feed_data(response)
+    reader.feed_eof()
 
     result = await client._send_and_receive(b"OPTIONS icap://test ICAP/1.0\r\n\r\n")
 
@@ -1038,20 +1056,13 @@ async def test_async_receive_response_with_content_length():
 
 
 @pytest.mark.asyncio
-async def test_async_receive_response_with_chunked_body():
+async def test_async_receive_response_with_chunked_body(connected_async_client):
     """Test async response handling with chunked transfer encoding."""
-    client = AsyncIcapClient("localhost", 1344)
+    client, reader, _ = connected_async_client
 
-    mock_reader = AsyncMock()
     response = b"ICAP/1.0 200 OK\r\nTransfer-Encoding: chunked\r\n\r\n5\r\nHello\r\n0\r\n\r\n"
-    mock_reader.read.return_value = response
-
-    mock_writer = MagicMock()
-    mock_writer.write = MagicMock()
-    mock_writer.drain = AsyncMock()
-
-    client._reader = mock_reader
-    client._writer = mock_writer
+    reader.feed_data(response)
+    reader.feed_eof()
 
     result = await client._send_and_receive(b"OPTIONS icap://test ICAP/1.0\r\n\r\n")
 
@@ -1059,114 +1070,103 @@ async def test_async_receive_response_with_chunked_body():
 
 
 @pytest.mark.asyncio
-async def test_async_receive_response_body_in_multiple_reads():
+async def test_async_receive_response_body_in_multiple_reads(connected_async_client):
     """Test async response where body requires multiple reads."""
-    client = AsyncIcapClient("localhost", 1344)
+    client, reader, _ = connected_async_client
+    reader.feed_data(b"ICAP/1.0 200 OK\r\nContent-Length: 15\r\n\r\nHello")
+    reader.feed_data(b" World!!!!")
+    reader.feed_eof()
 
-    mock_reader = AsyncMock()
-    mock_reader.read.side_effect = [
-        b"ICAP/1.0 200 OK\r\nContent-Length: 15\r\n\r\nHello",
-        b" World!!!!",  # Remaining 10 bytes
-    ]
+    result = await client._send_and_receive(b"OPTIONS icap://test ICAP/1.0\r\n\r\n")
 
-    mock_writer = MagicMock()
-    mock_writer.write = MagicMock()
-    mock_writer.drain = AsyncMock()
+    assert result.status_code == 200
 
-    client._reader = mock_reader
-    client._writer = mock_writer
 
-    result = await client._send_and_receive(b"OPTIONS icap://test ICAP/1.0\r\n\r\n")
+@pytest.mark.asyncio
+async def test_async_receive_response_empty_on_first_read(connected_async_client):
+    """Test async response handling when the connection closes before any data."""
+    client, reader, _ = connected_async_client
+    reader.feed_eof()
 
-    assert result.status_code == 200
+    with pytest.raises(IcapProtocolError) as exc_info:
+        await client._receive_response()
+
+    assert "Connection closed before response headers complete" in str(exc_info.value)
 
 
 @pytest.mark.asyncio
-async def test_async_receive_response_empty_on_first_read():
-    """Test async response handling when first read returns empty (connection closed)."""
-    client = AsyncIcapClient("localhost", 1344)
+async def test_async_receive_response_truncated_headers(connected_async_client):
+    """Test a header block cut off by the connection closing is an error, not a response."""
+    client, reader, _ = connected_async_client
+    reader.feed_data(b"ICAP/1.0 200 OK\r\nServer: Te")
+    reader.feed_eof()
+
+    with pytest.raises(IcapProtocolError) as exc_info:
+        await client._receive_response()
+
+    assert "(27 bytes received)" in str(exc_info.value)
 
-    mock_reader = AsyncMock()
-    mock_reader.read.return_value = b""  # Connection closed immediately
 
-    client._reader = mock_reader
+@pytest.mark.asyncio
+async def test_async_receive_response_leaves_next_response_unread(connected_async_client):
+    """Test only the current response is consumed from the stream."""
+    client, reader, _ = connected_async_client
+    reader.feed_data(b"ICAP/1.0 200 OK\r\nContent-Length: 3\r\n\r\nabc" + RESP_204)
 
-    # This should not raise, just return empty response data
     response_data = await client._receive_response()
-    assert response_data == b""
+
+    assert response_data.endswith(b"\r\n\r\nabc")
+    assert await client._receive_response() == RESP_204
 
 
 @pytest.mark.asyncio
-async def test_async_read_chunked_body_with_extensions():
+async def test_async_read_chunked_body_with_extensions(connected_async_client):
     """Test async chunked body with chunk extensions (after semicolon)."""
-    client = AsyncIcapClient("localhost", 1344)
+    client, reader, _ = connected_async_client
+    reader.feed_data(b"5; ext=value\r\nHello\r\n0\r\n\r\n")
+    reader.feed_eof()
 
-    mock_reader = AsyncMock()
-    mock_reader.read.return_value = b""
-
-    client._reader = mock_reader
-    client._connected = True
-
-    body = await client._read_chunked_body(b"5; ext=value\r\nHello\r\n0\r\n\r\n")
+    body = await client._read_chunked_body()
     assert body == b"Hello"
 
 
 @pytest.mark.asyncio
-async def test_async_read_chunked_body_invalid_chunk_size():
+async def test_async_read_chunked_body_invalid_chunk_size(connected_async_client):
     """Test async chunked body with invalid chunk size raises IcapProtocolError."""
-    client = AsyncIcapClient("localhost", 1344)
-
-    mock_reader = AsyncMock()
-    mock_reader.read.return_value = b""
-
-    client._reader = mock_reader
-    client._connected = True
+    client, reader, _ = connected_async_client
+    reader.feed_data(b"INVALID\r\ndata\r\n0\r\n\r\n")
+    reader.feed_eof()
 
     with pytest.raises(IcapProtocolError) as exc_info:
-        await client._read_chunked_body(b"INVALID\r\ndata\r\n0\r\n\r\n")
+        await client._read_chunked_body()
 
     assert "Invalid chunk size" in str(exc_info.value)
 
 
-def test_receive_response_chunked_with_extensions():
+def test_receive_response_chunked_with_extensions(connected_sync_client):
     """Test sync chunked body with chunk extensions."""
-    client = IcapClient("localhost", 1344)
-
-    mock_socket = MagicMock()
-    mock_socket.recv.return_value = b""
-
-    client._socket = mock_socket
-    client._connected = True
+    client, _ = connected_sync_client
 
     body = client._read_chunked_body(b"5; name=value\r\nHello\r\n0\r\n\r\n")
     assert body == b"Hello"
 
 
-def test_receive_response_no_content_length_no_chunked():
+def test_receive_response_no_content_length_no_chunked(connected_sync_client):
     """Test response without Content-Length or chunked encoding (like 204)."""
-    client = IcapClient("localhost", 1344)
+    client, sock = connected_sync_client
 
-    mock_socket = MagicMock()
     # 204 response with no body indicators
-    mock_socket.recv.return_value = b"ICAP/1.0 204 No Content\r\nServer: Test\r\n\r\n"
-
-    client._socket = mock_socket
-    client._connected = True
+    sock.queue(b"ICAP/1.0 204 No Content\r\nServer: Test\r\n\r\n")
 
     response = client._receive_response()
     assert response.status_code == 204
     assert response.body == b""
 
 
-def test_respmod_with_custom_headers():
+def test_respmod_with_custom_headers(connected_sync_client):
     """Test RESPMOD with custom ICAP headers."""
-    client = IcapClient("localhost", 1344)
-
-    mock_socket = MagicMock()
-    mock_socket.recv.return_value = b"ICAP/1.0 204 No Content\r\n\r\n"
-
-    client._socket = mock_socket
-    client._connected = True
+    client, sock = connected_sync_client
+    sock.queue(RESP_204)
 
     response = client.respmod(
         "avscan",
@@ -1176,42 +1176,76 @@ def test_respmod_with_custom_headers():
     )
 
     assert response.status_code == 204
-    sent_data = mock_socket.sendall.call_args[0][0]
+    sent_data = sock.sent[-1]
     assert b"X-Custom: value" in sent_data
 
 
-def test_scan_bytes_with_custom_service():
+def test_scan_bytes_with_custom_service(connected_sync_client):
     """Test scan_bytes with custom service name."""
-    client = IcapClient("localhost", 1344)
-
-    mock_socket = MagicMock()
-    mock_socket.recv.return_value = b"ICAP/1.0 204 No Content\r\n\r\n"
-
-    client._socket = mock_socket
-    client._connected = True
+    client, sock = connected_sync_client
+    sock.queue(RESP_204)
 
     response = client.scan_bytes(b"test content", service="custom_scan")
 
     assert response.status_code == 204
-    sent_data = mock_socket.sendall.call_args[0][0]
+    sent_data = sock.sent[-1]
     assert b"custom_scan" in sent_data
 
 
-def test_scan_file_uses_filename(tmp_path):
+def test_scan_file_uses_filename(connected_sync_client, tmp_path):
     """Test scan_file includes filename in request."""
     test_file = tmp_path / "report.pdf"
     test_file.write_bytes(b"PDF content")
 
-    client = IcapClient("localhost", 1344)
-
-    mock_socket = MagicMock()
-    mock_socket.recv.return_value = b"ICAP/1.0 204 No Content\r\n\r\n"
-
-    client._socket = mock_socket
-    client._connected = True
+    client, sock = connected_sync_client
+    sock.queue(RESP_204)
 
     response = client.scan_file(test_file)
 
     assert response.status_code == 204
-    sent_data = mock_socket.sendall.call_args[0][0]
+    sent_data = b"".join(sock.sent)
     assert b"report.pdf" in sent_data
+
+
+def test_scan_file_sends_body_with_sendfile(connected_sync_client, tmp_path):
+    """Test scan_file sends the file as one chunk via sendfile() on plain TCP."""
+    test_file = tmp_path / "data.bin"
+    test_file.write_bytes(b"x" * 300)
+
+    client, sock = connected_sync_client
+    sock.queue(RESP_204)
+
+    client.scan_file(test_file)
+
+    header, body, trailer = sock.sent
+    assert header.endswith(b"Content-Length: 300\r\n\r\n12C\r\n")
+    assert body == b"x" * 300
+    assert trailer == b"\r\n0\r\n\r\n"
+
+
+def test_scan_file_empty_file_sends_only_terminator(connected_sync_client, tmp_path):
+    """Test an empty file is sent as headers plus the zero-length chunk."""
+    test_file = tmp_path / "empty.bin"
+    test_file.write_bytes(b"")
+
+    client, sock = connected_sync_client
+    sock.queue(RESP_204)
+
+    client.scan_file(test_file)
+
+    assert len(sock.sent) == 1
+    assert sock.sent[0].endswith(b"Content-Length: 0\r\n\r\n0\r\n\r\n")
+
+
+def test_scan_file_with_ssl_streams_through_python(connected_sync_client, tmp_path, mocker):
+    """Test scan_file keeps the read-and-send path on TLS connections."""
+    test_file = tmp_path / "data.bin"
+    test_file.write_bytes(b"content")
+
+    client, _ = connected_sync_client
+    client._ssl_context = mocker.Mock()
+    scan_stream = mocker.patch.object(client, "scan_stream")
+
+    client.scan_file(test_file)
+
+    scan_stream.assert_called_once()
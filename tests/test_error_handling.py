@@ -40,14 +40,13 @@ def test_incomplete_status_line_raises_value_error():
         IcapResponse.parse(b"ICAP/1.0 200\r\n\r\n")
 
 
-def test_invalid_content_length_raises_protocol_error():
+def test_invalid_content_length_raises_protocol_error(recording_socket):
     """Test that invalid Content-Length header raises IcapProtocolError."""
     client = IcapClient("localhost", 1344)
 
-    mock_socket = MagicMock()
-    mock_socket.recv.return_value = b"ICAP/1.0 200 OK\r\nContent-Length: not-a-number\r\n\r\nbody"
+    recording_socket.queue(b"ICAP/1.0 200 OK\r\nContent-Length: not-a-number\r\n\r\nbody")
 
-    client._socket = mock_socket
+    client._socket = recording_socket
     client._connected = True
 
     with pytest.raises(IcapProtocolError) as exc_info:
@@ -56,16 +55,15 @@ def test_invalid_content_length_raises_protocol_error():
     assert "Invalid Content-Length" in str(exc_info.value)
 
 
-def test_invalid_chunk_size_raises_protocol_error():
+def test_invalid_chunk_size_raises_protocol_error(recording_socket):
     """Test that invalid chunk size in chunked encoding raises IcapProtocolError."""
     client = IcapClient("localhost", 1344)
 
-    mock_socket = MagicMock()
-    mock_socket.recv.side_effect = [
+    recording_socket.queue(
         b"ICAP/1.0 200 OK\r\nTransfer-Encoding: chunked\r\n\r\nnot-hex\r\n",
-    ]
+    )
 
-    client._socket = mock_socket
+    client._socket = recording_socket
     client._connected = True
 
     with pytest.raises(IcapProtocolError) as exc_info:
@@ -74,17 +72,16 @@ def test_invalid_chunk_size_raises_protocol_error():
     assert "Invalid chunk size" in str(exc_info.value)
 
 
-def test_incomplete_response_raises_protocol_error():
+def test_incomplete_response_raises_protocol_error(recording_socket):
     """Test that incomplete response (connection closed early) raises IcapProtocolError."""
     client = IcapClient("localhost", 1344)
 
-    mock_socket = MagicMock()
-    mock_socket.recv.side_effect = [
+    recording_socket.queue(
         b"ICAP/1.0 200 OK\r\nContent-Length: 100\r\n\r\npartial",
         b"",
-    ]
+    )
 
-    client._socket = mock_socket
+    client._socket = recording_socket
     client._connected = True
 
     with pytest.raises(IcapProtocolError) as exc_info:
@@ -94,14 +91,13 @@ def test_incomplete_response_raises_protocol_error():
     assert "expected 100 bytes" in str(exc_info.value)
 
 
-def test_500_internal_server_error():
+def test_500_internal_server_error(recording_socket):
     """Test that 500 response raises IcapServerError."""
     client = IcapClient("localhost", 1344)
 
-    mock_socket = MagicMock()
-    mock_socket.recv.return_value = b"ICAP/1.0 500 Internal Server Error\r\nServer: Test\r\n\r\n"
+    recording_socket.queue(b"ICAP/1.0 500 Internal Server Error\r\nServer: Test\r\n\r\n")
 
-    client._socket = mock_socket
+    client._socket = recording_socket
     client._connected = True
 
     with pytest.raises(IcapServerError) as exc_info:
@@ -111,14 +107,13 @@ def test_500_internal_server_error():
     assert "Internal Server Error" in str(exc_info.value)
 
 
-def test_502_bad_gateway():
+def test_502_bad_gateway(recording_socket):
     """Test that 502 response raises IcapServerError."""
     client = IcapClient("localhost", 1344)
 
-    mock_socket = MagicMock()
-    mock_socket.recv.return_value = b"ICAP/1.0 502 Bad Gateway\r\nServer: Test\r\n\r\n"
+    recording_socket.queue(b"ICAP/1.0 502 Bad Gateway\r\nServer: Test\r\n\r\n")
 
-    client._socket = mock_socket
+    client._socket = recording_socket
     client._connected = True
 
     with pytest.raises(IcapServerError) as exc_info:
@@ -127,14 +122,13 @@ def test_502_bad_gateway():
     assert "502" in str(exc_info.value)
 
 
-def test_503_service_unavailable():
+def test_503_service_unavailable(recording_socket):
     """Test that 503 response raises IcapServerError."""
     client = IcapClient("localhost", 1344)
 
-    mock_socket = MagicMock()
-    mock_socket.recv.return_value = b"ICAP/1.0 503 Service Unavailable\r\nServer: Test\r\n\r\n"
+    recording_socket.queue(b"ICAP/1.0 503 Service Unavailable\r\nServer: Test\r\n\r\n")
 
-    client._socket = mock_socket
+    client._socket = recording_socket
     client._connected = True
 
     with pytest.raises(IcapServerError) as exc_info:
@@ -143,16 +137,13 @@ def test_503_service_unavailable():
     assert "503" in str(exc_info.value)
 
 
-def test_505_version_not_supported():
+def test_505_version_not_supported(recording_socket):
     """Test that 505 response raises IcapServerError."""
     client = IcapClient("localhost", 1344)
 
-    mock_socket = MagicMock()
-    mock_socket.recv.return_value = (
-        b"ICAP/1.0 505 ICAP Version Not Supported\r\nServer: Test\r\n\r\n"
-    )
+    recording_socket.queue(b"ICAP/1.0 505 ICAP Version Not Supported\r\nServer: Test\r\n\r\n")
 
-    client._socket = mock_socket
+    client._socket = recording_socket
     client._connected = True
 
     with pytest.raises(IcapServerError) as exc_info:
@@ -161,14 +152,13 @@ def test_505_version_not_supported():
     assert "505" in str(exc_info.value)
 
 
-def test_4xx_does_not_raise_server_error():
+def test_4xx_does_not_raise_server_error(recording_socket):
     """Test that 4xx responses don't raise IcapServerError."""
     client = IcapClient("localhost", 1344)
 
-    mock_socket = MagicMock()
-    mock_socket.recv.return_value = b"ICAP/1.0 404 Service Not Found\r\nServer: Test\r\n\r\n"
+    recording_socket.queue(b"ICAP/1.0 404 Service Not Found\r\nServer: Test\r\n\r\n")
 
-    client._socket = mock_socket
+    client._socket = recording_socket
     client._connected = True
 
     response = client._receive_response()
@@ -180,7 +170,7 @@ def test_read_chunked_body_simple():
     client = IcapClient("localhost", 1344)
 
     mock_socket = MagicMock()
-    mock_socket.recv.return_value = b""
+    mock_socket.recv_into.return_value = 0
 
     client._socket = mock_socket
     client._connected = True
@@ -194,7 +184,7 @@ def test_read_chunked_body_with_extensions():
     client = IcapClient("localhost", 1344)
 
     mock_socket = MagicMock()
-    mock_socket.recv.return_value = b""
+    mock_socket.recv_into.return_value = 0
 
     client._socket = mock_socket
     client._connected = True
@@ -208,7 +198,7 @@ def test_read_chunked_body_empty():
     client = IcapClient("localhost", 1344)
 
     mock_socket = MagicMock()
-    mock_socket.recv.return_value = b""
+    mock_socket.recv_into.return_value = 0
 
     client._socket = mock_socket
     client._connected = True
@@ -217,17 +207,16 @@ def test_read_chunked_body_empty():
     assert body == b""
 
 
-def test_read_chunked_body_split_across_reads():
+def test_read_chunked_body_split_across_reads(recording_socket):
     """Test reading chunked body when data arrives in multiple reads."""
     client = IcapClient("localhost", 1344)
 
-    mock_socket = MagicMock()
-    mock_socket.recv.side_effect = [
+    recording_socket.queue(
         b"Hello",
         b"\r\n0\r\n\r\n",
-    ]
+    )
 
-    client._socket = mock_socket
+    client._socket = recording_socket
     client._connected = True
 
     body = client._read_chunked_body(b"5\r\n")
@@ -363,18 +352,17 @@ def test_204_no_modification_properties():
     assert response.body == b""
 
 
-def test_chunked_body_connection_close_raises_protocol_error():
+def test_chunked_body_connection_close_raises_protocol_error(recording_socket):
     """Test that connection close during chunked body raises IcapProtocolError."""
     client = IcapClient("localhost", 1344)
 
-    mock_socket = MagicMock()
     # First recv returns chunk size, second returns empty (connection closed)
-    mock_socket.recv.side_effect = [
+    recording_socket.queue(
         b"5\r\nHello",  # Partial chunk data
         b"",  # Connection closed before terminator
-    ]
+    )
 
-    client._socket = mock_socket
+    client._socket = recording_socket
     client._connected = True
 
     with pytest.raises(IcapProtocolError) as exc_info:
@@ -383,16 +371,15 @@ def test_chunked_body_connection_close_raises_protocol_error():
     assert "Connection closed before chunked body complete" in str(exc_info.value)
 
 
-def test_chunked_body_connection_close_during_chunk_data():
+def test_chunked_body_connection_close_during_chunk_data(recording_socket):
     """Test connection close while reading chunk data raises IcapProtocolError."""
     client = IcapClient("localhost", 1344)
 
-    mock_socket = MagicMock()
-    mock_socket.recv.side_effect = [
+    recording_socket.queue(
         b"",  # Connection closed immediately
-    ]
+    )
 
-    client._socket = mock_socket
+    client._socket = recording_socket
     client._connected = True
 
     with pytest.raises(IcapProtocolError) as exc_info:
@@ -423,7 +410,7 @@ def test_iter_chunks_io_error_raises_protocol_error():
     """Test that IOError during chunked stream read raises IcapProtocolError."""
     client = IcapClient("localhost", 1344)
 
-    mock_stream = MagicMock()
+    mock_stream = MagicMock(spec=["read"])
     mock_stream.read.side_effect = OSError("Device not ready")
 
     with pytest.raises(IcapProtocolError) as exc_info:
@@ -432,6 +419,19 @@ def test_iter_chunks_io_error_raises_protocol_error():
     assert "Failed to read from stream" in str(exc_info.value)
 
 
+def test_iter_chunk_frames_readinto_error_raises_protocol_error():
+    """Test that IOError during chunked stream readinto raises IcapProtocolError."""
+    client = IcapClient("localhost", 1344)
+
+    mock_stream = MagicMock(spec=["readinto"])
+    mock_stream.readinto.side_effect = OSError("Device not ready")
+
+    with pytest.raises(IcapProtocolError) as exc_info:
+        list(client._iter_chunk_frames(mock_stream, 1024))
+
+    assert "Failed to read from stream" in str(exc_info.value)
+
+
 def test_async_scan_stream_has_chunk_size_parameter():
     """Test that AsyncIcapClient.scan_stream accepts chunk_size parameter."""
     import inspect
@@ -733,8 +733,8 @@ async def test_async_scan_stream_chunked_timeout_raises_timeout_error(mocker):
 
     # Mock connection
     mock_writer = mocker.MagicMock()
-    # write raises timeout error
-    mock_writer.write.side_effect = [None, asyncio.TimeoutError("Send timed out")]
+    # Sending the first chunk raises timeout error
+    mock_writer.writelines.side_effect = asyncio.TimeoutError("Send timed out")
     mock_writer.drain = mocker.AsyncMock()
 
     mock_reader = mocker.MagicMock()
@@ -764,8 +764,8 @@ async def test_async_scan_stream_chunked_oserror_raises_connection_error(mocker)
 
     # Mock connection
     mock_writer = mocker.MagicMock()
-    # First write succeeds, second raises OSError
-    mock_writer.write.side_effect = [None, OSError("Connection reset by peer")]
+    # Headers are written, sending the first chunk raises OSError
+    mock_writer.writelines.side_effect = OSError("Connection reset by peer")
     mock_writer.drain = mocker.AsyncMock()
 
     mock_reader = mocker.MagicMock()
@@ -839,6 +839,8 @@ async def test_async_send_and_receive_broken_pipe_raises_connection_error(mocker
 
 async def test_async_receive_response_invalid_content_length_raises_protocol_error(mocker):
     """Test that invalid Content-Length raises IcapProtocolError in async client."""
+    import asyncio
+
     from icap import AsyncIcapClient
     from icap.exception import IcapProtocolError
 
@@ -848,14 +850,13 @@ async def test_async_receive_response_invalid_content_length_raises_protocol_err
     mock_writer.write = mocker.MagicMock()
     mock_writer.drain = mocker.AsyncMock()
 
-    mock_reader = mocker.MagicMock()
-    mock_reader.read = mocker.AsyncMock(
-        return_value=b"ICAP/1.0 200 OK\r\nContent-Length: not-a-number\r\n\r\nbody"
-    )
+    reader = asyncio.StreamReader()
+    reader.feed_data(b"ICAP/1.0 200 OK\r\nContent-Length: not-a-number\r\n\r\nbody")
+    reader.feed_eof()
 
     mocker.patch(
         "asyncio.open_connection",
-        return_value=(mock_reader, mock_writer),
+        return_value=(reader, mock_writer),
     )
 
     await client.connect()
@@ -868,6 +869,8 @@ async def test_async_receive_response_invalid_content_length_raises_protocol_err
 
 async def test_async_receive_response_incomplete_body_raises_protocol_error(mocker):
     """Test that incomplete body raises IcapProtocolError in async client."""
+    import asyncio
+
     from icap import AsyncIcapClient
     from icap.exception import IcapProtocolError
 
@@ -877,18 +880,14 @@ async def test_async_receive_response_incomplete_body_raises_protocol_error(mock
     mock_writer.write = mocker.MagicMock()
     mock_writer.drain = mocker.AsyncMock()
 
-    mock_reader = mocker.MagicMock()
-    # First read returns headers with Content-Length: 100, second read returns partial body then EOF
-    mock_reader.read = mocker.AsyncMock(
-        side_effect=[
-            b"ICAP/1.0 200 OK\r\nContent-Length: 100\r\n\r\npartial",
-            b"",  # Connection closed before all bytes received
-        ]
-    )
+    # Headers with Content-Length: 100, a partial body, then the connection closes
+    reader = asyncio.StreamReader()
+    reader.feed_data(b"ICAP/1.0 200 OK\r\nContent-Length: 100\r\n\r\npartial")
+    reader.feed_eof()
 
     mocker.patch(
         "asyncio.open_connection",
-        return_value=(mock_reader, mock_writer),
+        return_value=(reader, mock_writer),
     )
 
     await client.connect()
@@ -901,6 +900,8 @@ async def test_async_receive_response_incomplete_body_raises_protocol_error(mock
 
 async def test_async_send_and_receive_server_error_raises_server_error(mocker):
     """Test that 5xx response raises IcapServerError in async client."""
+    import asyncio
+
     from icap import AsyncIcapClient
     from icap.exception import IcapServerError
 
@@ -910,14 +911,13 @@ async def test_async_send_and_receive_server_error_raises_server_error(mocker):
     mock_writer.write = mocker.MagicMock()
     mock_writer.drain = mocker.AsyncMock()
 
-    mock_reader = mocker.MagicMock()
-    mock_reader.read = mocker.AsyncMock(
-        return_value=b"ICAP/1.0 500 Internal Server Error\r\nServer: Test\r\n\r\n"
-    )
+    reader = asyncio.StreamReader()
+    reader.feed_data(b"ICAP/1.0 500 Internal Server Error\r\nServer: Test\r\n\r\n")
+    reader.feed_eof()
 
     mocker.patch(
         "asyncio.open_connection",
-        return_value=(mock_reader, mock_writer),
+        return_value=(reader, mock_writer),
     )
 
     await client.connect()
@@ -941,25 +941,15 @@ async def test_async_receive_response_timeout_during_body_raises_timeout_error(m
     mock_writer.write = mocker.MagicMock()
     mock_writer.drain = mocker.AsyncMock()
 
-    mock_reader = mocker.MagicMock()
-    # First read returns headers, second read times out
-    mock_reader.read = mocker.AsyncMock(
-        side_effect=[
-            b"ICAP/1.0 200 OK\r\nContent-Length: 100\r\n\r\npartial",
-            asyncio.TimeoutError("Read timed out"),
-        ]
-    )
+    # Headers and part of the body arrive, then the server goes quiet
+    reader = asyncio.StreamReader()
+    reader.feed_data(b"ICAP/1.0 200 OK\r\nContent-Length: 100\r\n\r\npartial")
 
     mocker.patch(
         "asyncio.open_connection",
-        return_value=(mock_reader, mock_writer),
+        return_value=(reader, mock_writer),
     )
 
-    async def mock_wait_for(coro, timeout):
-        return await coro
-
-    mocker.patch("asyncio.wait_for", mock_wait_for)
-
     await client.connect()
 
     with pytest.raises(IcapTimeoutError) as exc_info:
@@ -970,6 +960,8 @@ async def mock_wait_for(coro, timeout):
 
 async def test_async_chunked_body_connection_closed_raises_protocol_error(mocker):
     """Test that connection closed during async chunked body raises IcapProtocolError."""
+    import asyncio
+
     from icap import AsyncIcapClient
     from icap.exception import IcapProtocolError
 
@@ -979,18 +971,14 @@ async def test_async_chunked_body_connection_closed_raises_protocol_error(mocker
     mock_writer.write = mocker.MagicMock()
     mock_writer.drain = mocker.AsyncMock()
 
-    mock_reader = mocker.MagicMock()
-    # First read returns chunked headers, second read returns partial chunk, third returns EOF
-    mock_reader.read = mocker.AsyncMock(
-        side_effect=[
-            b"ICAP/1.0 200 OK\r\nTransfer-Encoding: chunked\r\n\r\n5\r\nHello",
-            b"",  # Connection closed before chunk terminator
-        ]
-    )
+    # Chunked headers and a partial chunk, then the connection closes
+    reader = asyncio.StreamReader()
+    reader.feed_data(b"ICAP/1.0 200 OK\r\nTransfer-Encoding: chunked\r\n\r\n5\r\nHello")
+    reader.feed_eof()
 
     mocker.patch(
         "asyncio.open_connection",
-        return_value=(mock_reader, mock_writer),
+        return_value=(reader, mock_writer),
     )
 
     await client.connect()
@@ -1003,6 +991,8 @@ async def test_async_chunked_body_connection_closed_raises_protocol_error(mocker
 
 async def test_async_scan_bytes_auto_connects(mocker):
     """Test that async scan_bytes auto-connects if not connected."""
+    import asyncio
+
     from icap import AsyncIcapClient
 
     client = AsyncIcapClient("localhost", 1344)
@@ -1011,12 +1001,13 @@ async def test_async_scan_bytes_auto_connects(mocker):
     mock_writer.write = mocker.MagicMock()
     mock_writer.drain = mocker.AsyncMock()
 
-    mock_reader = mocker.MagicMock()
-    mock_reader.read = mocker.AsyncMock(return_value=b"ICAP/1.0 204 No Modification\r\n\r\n")
+    reader = asyncio.StreamReader()
+    reader.feed_data(b"ICAP/1.0 204 No Modification\r\n\r\n")
+    reader.feed_eof()
 
     mocker.patch(
         "asyncio.open_connection",
-        return_value=(mock_reader, mock_writer),
+        return_value=(reader, mock_writer),
     )
 
     # Should auto-connect and complete the scan
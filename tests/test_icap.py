@@ -201,6 +201,12 @@ def test_protocol_build_request():
     assert b"OPTIONS icap://localhost:1344/avscan ICAP/1.0\r\n" in result
     assert b"Host: localhost:1344\r\n" in result
     assert b"User-Agent: Test\r\n" in result
+    assert result == (
+        b"OPTIONS icap://localhost:1344/avscan ICAP/1.0\r\n"
+        b"Host: localhost:1344\r\n"
+        b"User-Agent: Test\r\n"
+        b"\r\n"
+    )
 
 
 def test_protocol_build_http_request_header_with_filename():
@@ -233,6 +239,7 @@ def test_protocol_build_http_response_header():
     assert b"HTTP/1.1 200 OK\r\n" in result
     assert b"Content-Type: application/octet-stream\r\n" in result
     assert b"Content-Length: 100\r\n" in result
+    assert result.endswith(b"Content-Length: 100\r\n\r\n")
 
 
 def test_protocol_build_http_response_header_chunked():
@@ -262,6 +269,14 @@ def test_protocol_encode_chunked_empty():
     assert result == b""
 
 
+def test_protocol_chunk_header():
+    """Test _chunk_header returns the cached hex size line."""
+    from icap._protocol import IcapProtocol
+
+    assert IcapProtocol._chunk_header(65536) == b"10000\r\n"
+    assert IcapProtocol._chunk_header(30) is IcapProtocol._chunk_header(30)
+
+
 def test_protocol_encode_chunk_terminator():
     """Test _encode_chunk_terminator static method."""
     from icap._protocol import IcapProtocol
@@ -270,6 +285,125 @@ def test_protocol_encode_chunk_terminator():
     assert result == b"0\r\n\r\n"
 
 
+def test_protocol_build_preview_request():
+    """Test the preview message ends with ieof only when the body fits in the preview."""
+    from icap._protocol import IcapProtocol
+
+    protocol = IcapProtocol()
+
+    assert protocol._build_preview_request(b"REQ\r\n\r\n", b"small", 10) == (
+        b"REQ\r\n\r\n5\r\nsmall\r\n0; ieof\r\n\r\n"
+    )
+    assert protocol._build_preview_request(b"REQ\r\n\r\n", b"0123456789ab", 10) == (
+        b"REQ\r\n\r\nA\r\n0123456789\r\n0\r\n\r\n"
+    )
+    assert protocol._build_preview_request(b"REQ\r\n\r\n", b"", 10) == b"REQ\r\n\r\n0; ieof\r\n\r\n"
+
+
+def test_protocol_build_preview_remainder():
+    """Test the remainder after a preview is one chunk plus the terminator."""
+    from icap._protocol import IcapProtocol
+
+    protocol = IcapProtocol()
+
+    assert protocol._build_preview_remainder(b"0123456789ab", 10) == b"2\r\nab\r\n0\r\n\r\n"
+    assert protocol._build_preview_remainder(b"0123456789", 10) == b"0\r\n\r\n"
+
+
+def test_protocol_parse_body_framing():
+    """Test _parse_body_framing matches header names case-insensitively."""
+    from icap._protocol import IcapProtocol
+    from icap.exception import IcapProtocolError
+
+    protocol = IcapProtocol()
+
+    assert protocol._parse_body_framing(b"ICAP/1.0 204 No Content") == (None, False)
+    assert protocol._parse_body_framing(
+        b"ICAP/1.0 200 OK\r\nServer: Test\r\nCONTENT-length: 12"
+    ) == (12, False)
+    assert protocol._parse_body_framing(
+        b"ICAP/1.0 200 OK\r\ntransfer-encoding: Chunked\r\nX-Note: content-length: 1"
+    ) == (None, True)
+
+    # Repeated identical values are harmless, differing ones are ambiguous
+    assert protocol._parse_body_framing(
+        b"ICAP/1.0 200 OK\r\nContent-Length: 5\r\nContent-Length: 5"
+    ) == (5, False)
+    with pytest.raises(IcapProtocolError, match="Conflicting Content-Length"):
+        protocol._parse_body_framing(b"ICAP/1.0 200 OK\r\nContent-Length: 5\r\nContent-Length: 6")
+
+    # 1xx and 204 responses never carry a body, so their headers are not scanned
+    assert protocol._parse_body_framing(b"ICAP/1.0 204 No Content\r\nContent-Length: 100") == (
+        None,
+        False,
+    )
+    assert protocol._parse_body_framing(b"ICAP/1.0 100 Continue\r\nTransfer-Encoding: chunked") == (
+        None,
+        False,
+    )
+
+    # Whitespace between a field name and its colon is rejected, not stripped
+    with pytest.raises(IcapProtocolError, match="Invalid header field name"):
+        protocol._parse_body_framing(b"ICAP/1.0 200 OK\r\nContent-Length : 12")
+
+
+def test_protocol_parse_content_length():
+    """Test _parse_content_length accepts plain ASCII decimal only."""
+    from icap._protocol import IcapProtocol
+    from icap.exception import IcapProtocolError
+
+    assert IcapProtocol._parse_content_length(b"0") == 0
+    assert IcapProtocol._parse_content_length(b"1024") == 1024
+
+    for value in (b"", b"+5", b"-5", b"1_000", b"0x10", b"1 0", b"1\xff0", "١".encode()):
+        with pytest.raises(IcapProtocolError, match="Invalid Content-Length"):
+            IcapProtocol._parse_content_length(value)
+
+
+def test_protocol_parse_chunk_size():
+    """Test _parse_chunk_size accepts plain hex only."""
+    from icap._protocol import IcapProtocol
+    from icap.exception import IcapProtocolError
+
+    assert IcapProtocol._parse_chunk_size(b"0") == 0
+    assert IcapProtocol._parse_chunk_size(b"1aF") == 0x1AF
+    assert IcapProtocol._parse_chunk_size(b"10 ; ext=value") == 16
+
+    for size_line in (b"", b"-5", b"+5", b"0x10", b"1_0", b"G"):
+        with pytest.raises(IcapProtocolError, match="Invalid chunk size"):
+            IcapProtocol._parse_chunk_size(size_line)
+
+
+def test_protocol_decode_chunked():
+    """Test _decode_chunked decodes complete chunks and stops at partial ones."""
+    from icap._protocol import IcapProtocol
+
+    out = bytearray()
+    assert IcapProtocol._decode_chunked(b"5\r\nHello\r\n3\r\nWor", out) == (10, False)
+    assert out == b"Hello"
+
+    out = bytearray()
+    assert IcapProtocol._decode_chunked(b"3\r\nabc\r\n0\r\nX-Trailer: 1\r\n\r\n", out) == (27, True)
+    assert out == b"abc"
+
+    # Terminator without its closing empty line is not finished yet
+    assert IcapProtocol._decode_chunked(b"0\r\n", bytearray()) == (0, False)
+
+
+def test_protocol_raise_for_status():
+    """Test _raise_for_status raises only for mapped status classes."""
+    from icap._protocol import IcapProtocol
+    from icap.exception import IcapServerError
+
+    protocol = IcapProtocol()
+
+    for status_code in (100, 200, 204, 404):
+        protocol._raise_for_status(IcapResponse(status_code, "Status", {}, b""))
+
+    with pytest.raises(IcapServerError, match="503 Service Unavailable"):
+        protocol._raise_for_status(IcapResponse(503, "Service Unavailable", {}, b""))
+
+
 def test_response_repr():
     """Test IcapResponse.__repr__ method."""
     response = IcapResponse(200, "OK", {}, b"")
@@ -325,3 +459,49 @@ def test_response_parse_with_empty_headers():
     assert response.status_code == 200
     assert response.headers == {}
     assert response.body == b"body content"
+
+
+def test_response_parse_header_whitespace_and_colons():
+    """Test header values keep inner colons and lines without a colon are skipped."""
+    raw = (
+        b"ICAP/1.0 200 OK\r\n"
+        b'ISTag:  "W3E4R7U9-L2E4-2" \r\n'
+        b"X-Malformed-Line\r\n"
+        b"Service: Scanner: v1.2\r\n"
+        b"\r\n"
+    )
+    response = IcapResponse.parse(raw)
+
+    assert response.headers == {"ISTag": '"W3E4R7U9-L2E4-2"', "Service": "Scanner: v1.2"}
+
+
+def test_response_headers_parsed_on_first_access():
+    """Test parse defers header parsing until headers are read."""
+    response = IcapResponse.parse(b"ICAP/1.0 200 OK\r\nISTag: abc\r\n\r\n")
+
+    assert response._headers is None
+    assert response.headers == {"ISTag": "abc"}
+    assert response.headers is response.headers
+
+    response.headers = {"X-Virus-ID": "EICAR"}
+    assert response.headers == {"X-Virus-ID": "EICAR"}
+
+
+def test_response_parse_rejects_non_three_digit_status_code():
+    """Test status codes must be exactly three ASCII digits."""
+    for raw in (b"ICAP/1.0 20 OK\r\n\r\n", b"ICAP/1.0 2000 OK\r\n\r\n", b"ICAP/1.0 +20 OK\r\n\r\n"):
+        with pytest.raises(ValueError, match="Invalid ICAP status code"):
+            IcapResponse.parse(raw)
+
+    assert IcapResponse.parse(b"ICAP/1.0 503 Service Unavailable\r\n\r\n").status_code == 503
+
+
+def test_response_parse_reuses_common_status_messages():
+    """Test common reason phrases are shared and uncommon ones are decoded."""
+    first = IcapResponse.parse(b"ICAP/1.0 204 No Content\r\n\r\n")
+    second = IcapResponse.parse(b"ICAP/1.0 204 No Content\r\n\r\n")
+    assert first.status_message == "No Content"
+    assert first.status_message is second.status_message
+
+    custom = IcapResponse.parse(b"ICAP/1.0 200 All Good\r\n\r\n")
+    assert custom.status_message == "All Good"
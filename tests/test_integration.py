@@ -24,35 +24,34 @@
     ICAP-level polling via wait_for_icap_service() for reliable service
     readiness detection. This approach is actually more robust as it verifies
     the ICAP protocol is responding, not just that the container is healthy.
+
+Connection Reuse:
+    Tests that only send clean content borrow a connection from the
+    session-wide icap_pool fixture. Tests that scan EICAR, or that check
+    connection behaviour itself, open their own IcapClient, because some
+    servers close the connection after reporting a virus.
 """
 
+import io
+
 import pytest
 
 from examples.test_utils import EICAR_TEST_STRING
 from icap import IcapClient
 
+CLEAN_CONTENT = b"Clean test content"
+
 
 @pytest.mark.integration
 @pytest.mark.docker
-def test_options_request(icap_service):
+def test_options_request(icap_pool, icap_service):
     """Test OPTIONS request against real ICAP server."""
-    with IcapClient(icap_service["host"], icap_service["port"]) as client:
+    with icap_pool.client() as client:
         response = client.options(icap_service["service"])
         assert response.is_success
         assert response.status_code == 200
 
 
-@pytest.mark.integration
-@pytest.mark.docker
-def test_scan_clean_content(icap_service):
-    """Test scanning clean content."""
-    with IcapClient(icap_service["host"], icap_service["port"]) as client:
-        clean_content = b"This is clean text content"
-        response = client.scan_bytes(clean_content, service=icap_service["service"])
-        # Should return 204 (no modification) for clean content
-        assert response.is_success
-
-
 @pytest.mark.integration
 @pytest.mark.docker
 def test_scan_eicar_virus(icap_service):
@@ -65,51 +64,38 @@ def test_scan_eicar_virus(icap_service):
         # TODO: Use the syrupy snapshot extension to assert against the response txt
 
 
-@pytest.mark.integration
-@pytest.mark.docker
-def test_scan_file_path_str(icap_service, tmp_path):
-    """Test scanning a file using string path."""
-    # Create a temporary file
-    test_file = tmp_path / "test.txt"
-    test_file.write_bytes(b"Clean test content")
-
-    with IcapClient(icap_service["host"], icap_service["port"]) as client:
-        response = client.scan_file(str(test_file), service=icap_service["service"])
-        assert response.is_success
+@pytest.fixture(scope="session")
+def clean_file(tmp_path_factory):
+    """Write the clean test file once for the file scan cases."""
+    path = tmp_path_factory.mktemp("data") / "test.txt"
+    path.write_bytes(CLEAN_CONTENT)
+    return path
 
 
 @pytest.mark.integration
 @pytest.mark.docker
-def test_scan_file_path_object(icap_service, tmp_path):
-    """Test scanning a file using Path object."""
-    # Create a temporary file
-    test_file = tmp_path / "test.txt"
-    test_file.write_bytes(b"Clean test content")
-
-    with IcapClient(icap_service["host"], icap_service["port"]) as client:
-        response = client.scan_file(test_file, service=icap_service["service"])
+@pytest.mark.parametrize("source", ["bytes", "str", "path", "stream"])
+def test_scan_clean_content(icap_pool, icap_service, clean_file, source):
+    """Test scanning clean bytes, a file by str and Path, and a file-like object."""
+    service = icap_service["service"]
+    with icap_pool.client() as client:
+        if source == "bytes":
+            response = client.scan_bytes(CLEAN_CONTENT, service=service)
+        elif source == "str":
+            response = client.scan_file(str(clean_file), service=service)
+        elif source == "path":
+            response = client.scan_file(clean_file, service=service)
+        else:
+            response = client.scan_stream(io.BytesIO(CLEAN_CONTENT), service=service)
+        # Should return 204 (no modification) for clean content
         assert response.is_success
 
 
 @pytest.mark.integration
 @pytest.mark.docker
-def test_scan_stream(icap_service, tmp_path):
-    """Test scanning a file-like object."""
-    # Create a temporary file
-    test_file = tmp_path / "test.txt"
-    test_file.write_bytes(b"Clean test content")
-
-    with IcapClient(icap_service["host"], icap_service["port"]) as client:
-        with open(test_file, "rb") as f:
-            response = client.scan_stream(f, service=icap_service["service"])
-            assert response.is_success
-
-
-@pytest.mark.integration
-@pytest.mark.docker
-def test_respmod_with_preview_small_content(icap_service):
+def test_respmod_with_preview_small_content(icap_pool, icap_service):
     """Test RESPMOD with preview mode where content fits in preview (ieof case)."""
-    with IcapClient(icap_service["host"], icap_service["port"]) as client:
+    with icap_pool.client() as client:
         # Small content that fits entirely in preview
         content = b"Small clean content"
         http_request = b"GET /test.txt HTTP/1.1\r\nHost: test\r\n\r\n"
@@ -132,9 +118,9 @@ def test_respmod_with_preview_small_content(icap_service):
 
 @pytest.mark.integration
 @pytest.mark.docker
-def test_respmod_with_preview_large_content(icap_service):
+def test_respmod_with_preview_large_content(icap_pool, icap_service):
     """Test RESPMOD with preview mode where content exceeds preview size."""
-    with IcapClient(icap_service["host"], icap_service["port"]) as client:
+    with icap_pool.client() as client:
         # Content larger than preview size
         content = b"A" * 2048  # 2KB of content
         http_request = b"GET /test.bin HTTP/1.1\r\nHost: test\r\n\r\n"
@@ -182,9 +168,9 @@ def test_respmod_with_preview_eicar(icap_service):
 
 @pytest.mark.integration
 @pytest.mark.docker
-def test_reqmod_basic(icap_service):
+def test_reqmod_basic(icap_pool, icap_service):
     """Test basic REQMOD request without body."""
-    with IcapClient(icap_service["host"], icap_service["port"]) as client:
+    with icap_pool.client() as client:
         http_request = b"GET /clean.txt HTTP/1.1\r\nHost: example.com\r\n\r\n"
 
         response = client.reqmod(icap_service["service"], http_request)
@@ -193,9 +179,9 @@ def test_reqmod_basic(icap_service):
 
 @pytest.mark.integration
 @pytest.mark.docker
-def test_reqmod_with_body(icap_service):
+def test_reqmod_with_body(icap_pool, icap_service):
     """Test REQMOD with HTTP request body."""
-    with IcapClient(icap_service["host"], icap_service["port"]) as client:
+    with icap_pool.client() as client:
         http_request = (
             b"POST /upload HTTP/1.1\r\n"
             b"Host: example.com\r\n"
@@ -6,6 +6,7 @@
 
 import pytest
 
+from examples.test_utils import EICAR_TEST_STRING
 from icap import IcapResponse
 from icap.exception import IcapConnectionError, IcapTimeoutError
 from icap.pytest_plugin import (
@@ -16,6 +17,17 @@
     MockResponseExhaustedError,
 )
 
+
+@pytest.fixture(scope="session")
+def scan_files(tmp_path_factory):
+    """Write the files read by scan_file tests once per session."""
+    directory = tmp_path_factory.mktemp("scans")
+    (directory / "test.txt").write_bytes(b"file content")
+    (directory / "small.txt").write_bytes(b"x" * 50)
+    (directory / "large.txt").write_bytes(b"x" * 200)
+    return directory
+
+
 # === IcapResponseBuilder Tests ===
 
 
@@ -253,6 +265,20 @@ def test_mock_client_exception_injection():
         client.scan_bytes(b"test")
 
 
+def test_mock_client_exception_class_injection():
+    """raises= accepts an exception class and raises a fresh instance per call."""
+    client = MockIcapClient()
+    client.on_respmod(raises=IcapTimeoutError)
+
+    with pytest.raises(IcapTimeoutError) as first:
+        client.scan_bytes(b"one")
+    with pytest.raises(IcapTimeoutError) as second:
+        client.scan_bytes(b"two")
+
+    assert first.value is not second.value
+    assert client.calls[0].exception is first.value
+
+
 def test_mock_client_context_manager():
     """Mock supports context manager."""
     with MockIcapClient() as client:
@@ -269,13 +295,10 @@ def test_mock_client_host_port_properties():
     assert client.port == 1234
 
 
-def test_mock_client_scan_file(tmp_path):
+def test_mock_client_scan_file(scan_files):
     """scan_file() reads and records file content."""
-    test_file = tmp_path / "test.txt"
-    test_file.write_bytes(b"file content")
-
     client = MockIcapClient()
-    response = client.scan_file(test_file)
+    response = client.scan_file(scan_files / "test.txt")
     assert response.is_no_modification
     client.assert_called("scan_file", times=1)
     assert client.calls[0].kwargs["data"] == b"file content"
@@ -300,7 +323,6 @@ def test_mock_client_scan_stream():
 # === MockAsyncIcapClient Tests ===
 
 
-@pytest.mark.asyncio
 async def test_async_mock_client_scan_bytes():
     """Async mock returns clean responses."""
     client = MockAsyncIcapClient()
@@ -308,7 +330,6 @@ async def test_async_mock_client_scan_bytes():
     assert response.is_no_modification
 
 
-@pytest.mark.asyncio
 async def test_async_mock_client_context_manager():
     """Async mock supports async context manager."""
     async with MockAsyncIcapClient() as client:
@@ -318,7 +339,6 @@ async def test_async_mock_client_context_manager():
     assert not client.is_connected
 
 
-@pytest.mark.asyncio
 async def test_async_mock_client_records_calls():
     """Async mock records method calls."""
     client = MockAsyncIcapClient()
@@ -327,7 +347,6 @@ async def test_async_mock_client_records_calls():
     client.assert_called("scan_bytes")
 
 
-@pytest.mark.asyncio
 async def test_async_mock_client_exception_injection():
     """Async mock can raise exceptions."""
     client = MockAsyncIcapClient()
@@ -336,6 +355,14 @@ async def test_async_mock_client_exception_injection():
         await client.scan_bytes(b"test")
 
 
+async def test_async_mock_client_exception_class_injection():
+    """Async mock accepts an exception class for raises=."""
+    client = MockAsyncIcapClient()
+    client.on_any(raises=IcapConnectionError)
+    with pytest.raises(IcapConnectionError, match="Mock exception"):
+        await client.options("avscan")
+
+
 # === Mock Fixture Tests ===
 
 
@@ -345,7 +372,6 @@ def test_mock_icap_client_fixture(mock_icap_client):
     assert response.is_no_modification
 
 
-@pytest.mark.asyncio
 async def test_mock_async_icap_client_fixture(mock_async_icap_client):
     """mock_async_icap_client fixture works with async."""
     response = await mock_async_icap_client.scan_bytes(b"test")
@@ -468,6 +494,29 @@ def test_marker_per_method_config(icap_mock):
     assert response.status_code == 200
 
 
+@pytest.mark.parametrize(
+    ("icap_mock", "status_code", "virus_id"),
+    [
+        ({"response": "clean"}, 204, None),
+        ({"response": "virus", "virus_name": "Trojan.Param"}, 200, "Trojan.Param"),
+        ({"response": "error"}, 500, None),
+    ],
+    indirect=["icap_mock"],
+)
+def test_icap_mock_indirect_parametrization(icap_mock, status_code, virus_id):
+    """icap_mock accepts marker kwargs as an indirect parameter."""
+    response = icap_mock.scan_bytes(b"test")
+    assert response.status_code == status_code
+    assert response.headers.get("X-Virus-ID") == virus_id
+
+
+@pytest.mark.icap_mock(response="virus")
+@pytest.mark.parametrize("icap_mock", [{"response": "clean"}], indirect=True)
+def test_icap_mock_param_overrides_marker(icap_mock):
+    """An indirect parameter takes precedence over an icap_mock marker."""
+    assert icap_mock.scan_bytes(b"test").is_no_modification
+
+
 # === Response Sequence Tests ===
 
 
@@ -632,7 +681,6 @@ def test_scan_methods_share_respmod_queue():
     assert client.respmod("avscan", b"req", b"resp").headers["X-Virus-ID"] == "Second"
 
 
-@pytest.mark.asyncio
 async def test_async_response_sequence():
     """Async mock also supports response sequences."""
     client = MockAsyncIcapClient()
@@ -648,7 +696,6 @@ async def test_async_response_sequence():
     assert not response2.is_no_modification
 
 
-@pytest.mark.asyncio
 async def test_async_response_sequence_exhausted():
     """Async mock raises MockResponseExhaustedError when queue empty."""
     client = MockAsyncIcapClient()
@@ -713,9 +760,7 @@ def eicar_detector(data: bytes, **kwargs) -> IcapResponse:
     assert response1.is_no_modification
 
     # Content with EICAR
-    response2 = client.scan_bytes(
-        b"X5O!P%@AP[4\\PZX54(P^)7CC)7}$EICAR-STANDARD-ANTIVIRUS-TEST-FILE"
-    )
+    response2 = client.scan_bytes(EICAR_TEST_STRING)
     assert not response2.is_no_modification
     assert response2.headers["X-Virus-ID"] == "EICAR-Test"
 
@@ -786,7 +831,7 @@ def always_virus(data: bytes, **kwargs) -> IcapResponse:
     assert response2.is_no_modification
 
 
-def test_callback_works_with_scan_file(tmp_path):
+def test_callback_works_with_scan_file(scan_files):
     """Callback works with scan_file method."""
 
     def file_size_detector(data: bytes, **kwargs) -> IcapResponse:
@@ -798,15 +843,11 @@ def file_size_detector(data: bytes, **kwargs) -> IcapResponse:
     client.on_respmod(callback=file_size_detector)
 
     # Small file
-    small_file = tmp_path / "small.txt"
-    small_file.write_bytes(b"x" * 50)
-    response1 = client.scan_file(small_file)
+    response1 = client.scan_file(scan_files / "small.txt")
     assert response1.is_no_modification
 
     # Large file
-    large_file = tmp_path / "large.txt"
-    large_file.write_bytes(b"x" * 200)
-    response2 = client.scan_file(large_file)
+    response2 = client.scan_file(scan_files / "large.txt")
     assert not response2.is_no_modification
 
 
@@ -827,7 +868,6 @@ def counting_callback(data: bytes, **kwargs) -> IcapResponse:
     assert call_count[0] == 1
 
 
-@pytest.mark.asyncio
 async def test_async_callback_sync():
     """Async client works with sync callback."""
 
@@ -846,7 +886,6 @@ def sync_callback(data: bytes, **kwargs) -> IcapResponse:
     assert not response2.is_no_modification
 
 
-@pytest.mark.asyncio
 async def test_async_callback_async():
     """Async client works with async callback."""
 
@@ -867,7 +906,6 @@ async def async_callback(data: bytes, **kwargs) -> IcapResponse:
     assert response2.headers["X-Virus-ID"] == "Async.Malware"
 
 
-@pytest.mark.asyncio
 async def test_async_callback_receives_kwargs():
     """Async callback receives proper kwargs."""
     received = {}
@@ -1098,7 +1136,6 @@ def test_matcher_cleared_by_reset_responses():
     assert response2.is_no_modification
 
 
-@pytest.mark.asyncio
 async def test_async_matcher_filename():
     """Async client supports when() matchers."""
     client = MockAsyncIcapClient()
@@ -1113,7 +1150,6 @@ async def test_async_matcher_filename():
     assert response2.is_no_modification
 
 
-@pytest.mark.asyncio
 async def test_async_matcher_data_contains():
     """Async client when(data_contains=) works."""
     client = MockAsyncIcapClient()
@@ -1126,7 +1162,6 @@ async def test_async_matcher_data_contains():
     assert response2.is_no_modification
 
 
-@pytest.mark.asyncio
 async def test_async_matcher_priority_over_callback():
     """Async matchers take priority over async callbacks."""
 
@@ -1144,7 +1179,6 @@ async def async_callback(data: bytes, **kwargs) -> IcapResponse:
     assert response2.is_no_modification
 
 
-@pytest.mark.asyncio
 async def test_async_matcher_times_limit():
     """Async client respects times= limit on matchers."""
     client = MockAsyncIcapClient()
@@ -1660,10 +1694,9 @@ def test_assert_called_in_order_empty():
     client.assert_called_in_order([])  # Should pass
 
 
-def test_assert_scanned_file_passes(tmp_path):
+def test_assert_scanned_file_passes(scan_files):
     """assert_scanned_file passes when file was scanned."""
-    test_file = tmp_path / "test.txt"
-    test_file.write_bytes(b"content")
+    test_file = scan_files / "test.txt"
 
     client = MockIcapClient()
     client.scan_file(test_file)
@@ -1706,7 +1739,6 @@ def test_assert_scanned_with_filename_fails():
         client.assert_scanned_with_filename("expected.txt")
 
 
-@pytest.mark.asyncio
 async def test_async_mock_call_response_field():
     """Async MockCall.response is populated after successful call."""
     client = MockAsyncIcapClient()
@@ -1717,7 +1749,6 @@ async def test_async_mock_call_response_field():
     assert call.exception is None
 
 
-@pytest.mark.asyncio
 async def test_async_mock_call_exception_field():
     """Async MockCall.exception is populated when call raises."""
     client = MockAsyncIcapClient()
@@ -1731,7 +1762,6 @@ async def test_async_mock_call_exception_field():
     assert isinstance(call.exception, IcapTimeoutError)
 
 
-@pytest.mark.asyncio
 async def test_async_mock_call_matched_by():
     """Async MockCall.matched_by tracks response source correctly."""
     client = MockAsyncIcapClient()
@@ -1756,7 +1786,6 @@ async def async_cb(data: bytes, **kwargs):
     assert client.last_call.matched_by == "callback"
 
 
-@pytest.mark.asyncio
 async def test_async_call_query_methods():
     """Async client call query methods work correctly."""
     client = MockAsyncIcapClient()
@@ -1772,7 +1801,6 @@ async def test_async_call_query_methods():
     assert client.call_counts_by_method == {"options": 1, "scan_bytes": 2}
 
 
-@pytest.mark.asyncio
 async def test_async_enhanced_assertions():
     """Async client enhanced assertions work correctly."""
     client = MockAsyncIcapClient()
@@ -1917,7 +1945,6 @@ def test_assert_all_responses_used_shows_matcher_criteria():
     assert "filename_pattern=" in error_msg
 
 
-@pytest.mark.asyncio
 async def test_async_assert_all_responses_used_queue():
     """Async client assert_all_responses_used works with queues."""
     client = MockAsyncIcapClient()
@@ -1932,7 +1959,6 @@ async def test_async_assert_all_responses_used_queue():
     client.assert_all_responses_used()  # Should not raise
 
 
-@pytest.mark.asyncio
 async def test_async_assert_all_responses_used_fails_unconsumed():
     """Async client assert_all_responses_used fails with unconsumed responses."""
     client = MockAsyncIcapClient()
@@ -1949,7 +1975,6 @@ async def test_async_assert_all_responses_used_fails_unconsumed():
     assert "respmod: 1 of 2 queued responses not consumed" in str(exc_info.value)
 
 
-@pytest.mark.asyncio
 async def test_async_assert_all_responses_used_callback():
     """Async client assert_all_responses_used tracks callback usage."""
     client = MockAsyncIcapClient()
@@ -1964,7 +1989,6 @@ async def async_callback(**kwargs):
     client.assert_all_responses_used()  # Should not raise
 
 
-@pytest.mark.asyncio
 async def test_async_assert_all_responses_used_callback_unused():
     """Async client assert_all_responses_used fails with unused async callback."""
     client = MockAsyncIcapClient()
@@ -2028,7 +2052,6 @@ def test_marker_strict_mode_with_on_any_response(icap_mock):
 # === Additional Async Mock Client Method Tests ===
 
 
-@pytest.mark.asyncio
 async def test_async_mock_client_options():
     """Async mock options() method works correctly."""
     client = MockAsyncIcapClient()
@@ -2041,7 +2064,6 @@ async def test_async_mock_client_options():
     client.assert_called("options", times=1)
 
 
-@pytest.mark.asyncio
 async def test_async_mock_client_respmod():
     """Async mock respmod() method works correctly."""
     client = MockAsyncIcapClient()
@@ -2058,7 +2080,6 @@ async def test_async_mock_client_respmod():
     client.assert_called("respmod", times=1)
 
 
-@pytest.mark.asyncio
 async def test_async_mock_client_reqmod():
     """Async mock reqmod() method works correctly."""
     client = MockAsyncIcapClient()
@@ -2074,23 +2095,18 @@ async def test_async_mock_client_reqmod():
     client.assert_called("reqmod", times=1)
 
 
-@pytest.mark.asyncio
-async def test_async_mock_client_scan_file(tmp_path):
+async def test_async_mock_client_scan_file(scan_files):
     """Async mock scan_file() method works correctly."""
-    test_file = tmp_path / "test.txt"
-    test_file.write_bytes(b"test file content")
-
     client = MockAsyncIcapClient()
     client.on_respmod(IcapResponseBuilder().virus("File.Virus").build())
 
-    response = await client.scan_file(test_file)
+    response = await client.scan_file(scan_files / "test.txt")
 
     assert not response.is_no_modification
     client.assert_called("scan_file", times=1)
-    assert client.last_call.kwargs["data"] == b"test file content"
+    assert client.last_call.kwargs["data"] == b"file content"
 
 
-@pytest.mark.asyncio
 async def test_async_mock_client_scan_file_not_found():
     """Async mock scan_file() raises FileNotFoundError for missing files."""
     client = MockAsyncIcapClient()
@@ -2099,7 +2115,6 @@ async def test_async_mock_client_scan_file_not_found():
         await client.scan_file("/nonexistent/file.txt")
 
 
-@pytest.mark.asyncio
 async def test_async_mock_client_scan_stream():
     """Async mock scan_stream() method works correctly."""
     stream = io.BytesIO(b"stream content here")
@@ -2115,7 +2130,6 @@ async def test_async_mock_client_scan_stream():
     assert client.last_call.kwargs["filename"] == "stream.bin"
 
 
-@pytest.mark.asyncio
 async def test_async_mock_client_connect_disconnect():
     """Async mock connect() and disconnect() work correctly."""
     client = MockAsyncIcapClient()
@@ -2127,7 +2141,6 @@ async def test_async_mock_client_connect_disconnect():
     assert not client.is_connected
 
 
-@pytest.mark.asyncio
 async def test_async_mock_client_respmod_with_preview():
     """Async mock respmod() handles preview parameter."""
     client = MockAsyncIcapClient()
@@ -2143,7 +2156,6 @@ async def test_async_mock_client_respmod_with_preview():
     assert client.last_call.kwargs["preview"] == 1024
 
 
-@pytest.mark.asyncio
 async def test_async_mock_client_respmod_with_headers():
     """Async mock respmod() handles headers parameter."""
     client = MockAsyncIcapClient()
@@ -2159,7 +2171,6 @@ async def test_async_mock_client_respmod_with_headers():
     assert client.last_call.kwargs["headers"] == {"X-Custom": "value"}
 
 
-@pytest.mark.asyncio
 async def test_async_mock_client_reqmod_with_headers():
     """Async mock reqmod() handles headers parameter."""
     client = MockAsyncIcapClient()
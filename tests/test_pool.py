@@ -0,0 +1,139 @@
+"""
+Unit tests for IcapClientPool.
+
+Pooled clients are wired to recording sockets, so no ICAP server is needed.
+"""
+
+import socket
+import threading
+
+import pytest
+
+from icap import IcapClient, IcapClientPool
+from icap.exception import IcapServerError
+
+from .conftest import RecordingSocket
+
+RESP_204 = b"ICAP/1.0 204 No Content\r\n\r\n"
+
+
+@pytest.fixture
+def pool(mocker):
+    """Provide a pool whose new clients connect to fresh recording sockets."""
+    sockets = []
+
+    def fake_connect(client):
+        sock = RecordingSocket()
+        sock.queue(*[RESP_204] * 50)
+        sockets.append(sock)
+        client._socket = sock
+        client._connected = True
+
+    mocker.patch.object(IcapClient, "connect", autospec=True, side_effect=fake_connect)
+    # Recording sockets have no file descriptor to select() on
+    mocker.patch.object(IcapClientPool, "_is_reusable", side_effect=lambda c: c.is_connected)
+    pool = IcapClientPool("localhost", 1344, size=2)
+    pool.sockets = sockets
+    yield pool
+    pool.close()
+
+
+def test_pool_rejects_non_positive_size():
+    """Test the pool needs room for at least one idle connection."""
+    with pytest.raises(ValueError):
+        IcapClientPool("localhost", size=0)
+
+
+def test_pool_reuses_connection_across_scans(pool):
+    """Test consecutive scans share one connection."""
+    assert pool.scan_bytes(b"one").is_no_modification
+    assert pool.scan_bytes(b"two").is_no_modification
+
+    assert len(pool.sockets) == 1
+    assert len(pool.sockets[0].sent) == 2
+
+
+def test_pool_creates_clients_on_demand(pool):
+    """Test concurrently borrowed clients each get their own connection."""
+    first = pool.acquire()
+    second = pool.acquire()
+
+    assert first is not second
+    assert len(pool.sockets) == 2
+
+
+def test_pool_closes_clients_beyond_size(pool):
+    """Test at most ``size`` idle clients are kept."""
+    clients = [pool.acquire() for _ in range(3)]
+    for client in clients:
+        pool.release(client)
+
+    assert [client.is_connected for client in clients] == [True, True, False]
+
+
+def test_pool_discards_client_that_raised(pool, mocker):
+    """Test a client whose request failed is disconnected, not pooled."""
+    with pytest.raises(IcapServerError):
+        with pool.client() as client:
+            mocker.patch.object(client, "options", side_effect=IcapServerError("boom"))
+            client.options("avscan")
+
+    assert not client.is_connected
+    assert pool.acquire() is not client
+
+
+def test_pool_skips_stale_idle_client(pool):
+    """Test an idle client that lost its connection is replaced."""
+    client = pool.acquire()
+    pool.release(client)
+    client._connected = False
+
+    assert pool.acquire() is not client
+    assert len(pool.sockets) == 2
+
+
+def test_pool_close_disconnects_idle_clients(pool):
+    """Test close() disconnects every idle client."""
+    client = pool.acquire()
+    pool.release(client)
+
+    pool.close()
+
+    assert not client.is_connected
+
+
+def test_pool_is_thread_safe(pool):
+    """Test threads sharing the pool never exceed ``size`` idle clients."""
+    errors = []
+
+    def scan():
+        try:
+            for _ in range(5):
+                pool.scan_bytes(b"data")
+        except Exception as e:  # pragma: no cover - surfaced by the assert below
+            errors.append(e)
+
+    threads = [threading.Thread(target=scan) for _ in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert errors == []
+    assert len(pool._idle) <= pool.size
+
+
+def test_is_reusable_detects_closed_connection():
+    """Test an idle socket the peer has closed is not reused."""
+    ours, theirs = socket.socketpair()
+    try:
+        client = IcapClient("localhost", 1344)
+        client._socket = ours
+        client._connected = True
+
+        assert IcapClientPool._is_reusable(client)
+
+        theirs.close()
+        assert not IcapClientPool._is_reusable(client)
+    finally:
+        ours.close()